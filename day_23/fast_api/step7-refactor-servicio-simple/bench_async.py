@@ -0,0 +1,92 @@
+"""Benchmark de carga: rutas sync (main.py) vs async (main_async.py).
+
+Uso:
+    python bench_async.py
+
+Llama a las dos apps ASGI directamente (sin red) con la misma concurrencia,
+asi solo se mide el coste del framework: threadpool frente a event loop.
+"""
+import asyncio
+import json
+import time
+from itertools import count
+
+import main
+import main_async
+import service_async
+
+CONCURRENCY = [10, 100, 1_000]
+REQUESTS = 5_000
+_title_numbers = count()
+
+
+async def call(app, method: str, url: str, body: bytes = b"") -> int:
+    path, _, query = url.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("bench", 80),
+    }
+    request_sent = False
+    response_status = 0
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal response_status
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+
+    await app(scope, receive, send)
+    return response_status
+
+
+async def one_request(app, number: int) -> int:
+    # 80% lecturas paginadas, 20% altas con titulo unico.
+    if number % 5:
+        return await call(app, "GET", "/tasks?limit=20")
+    body = json.dumps({"title": f"Tarea bench {next(_title_numbers)}"}).encode()
+    return await call(app, "POST", "/tasks", body)
+
+
+async def run_load(app, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(number: int) -> int:
+        async with semaphore:
+            return await one_request(app, number)
+
+    started = time.perf_counter()
+    statuses = await asyncio.gather(*(limited(number) for number in range(REQUESTS)))
+    elapsed = time.perf_counter() - started
+    assert all(status in (200, 201) for status in statuses), set(statuses)
+    return REQUESTS / elapsed
+
+
+async def bench_async() -> None:
+    await service_async.startup()
+    print(f"{REQUESTS} peticiones por ronda (peticiones/segundo)")
+    print(f"{'concurrencia':>12} {'sync':>10} {'async':>10} {'mejora':>8}")
+    for concurrency in CONCURRENCY:
+        sync_rate = await run_load(main.app, concurrency)
+        async_rate = await run_load(main_async.app, concurrency)
+        print(f"{concurrency:>12} {sync_rate:>10,.0f} {async_rate:>10,.0f} {async_rate / sync_rate:>7.1f}x")
+    await service_async.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(bench_async())
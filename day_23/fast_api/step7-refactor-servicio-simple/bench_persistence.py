@@ -0,0 +1,58 @@
+"""Benchmark del write-ahead log de persistence.py.
+
+Uso:
+    python bench_persistence.py
+
+Mide la latencia de cada escritura en el log y el tiempo de recuperacion
+de 1M tareas, solo desde el log y desde snapshot.
+"""
+import statistics
+import tempfile
+import time
+
+from persistence import TaskLog
+from schemas import Task
+
+TASKS = 1_000_000
+
+
+def percentile(samples, fraction: float) -> float:
+    return sorted(samples)[int(len(samples) * fraction)]
+
+
+def bench_persistence() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        log = TaskLog(directory, snapshot_every=TASKS * 10)
+        log.recover()
+
+        tasks = [Task(id=task_id, title=f"Tarea {task_id}", done=task_id % 3 == 0) for task_id in range(1, TASKS + 1)]
+        latencies_us = []
+        for task in tasks:
+            started = time.perf_counter()
+            log.append_save(task)
+            latencies_us.append((time.perf_counter() - started) * 1_000_000)
+        log.close()
+
+        print(f"Escritura en el log ({TASKS:,} registros)")
+        print(f"  media {statistics.fmean(latencies_us):.1f} us")
+        print(f"  p50   {percentile(latencies_us, 0.50):.1f} us")
+        print(f"  p99   {percentile(latencies_us, 0.99):.1f} us")
+        print(f"  max   {max(latencies_us):.1f} us")
+
+        started = time.perf_counter()
+        log = TaskLog(directory)
+        recovered = log.recover()
+        print(f"Recuperacion solo desde log: {len(recovered):,} tareas en {time.perf_counter() - started:.2f} s")
+
+        log.snapshot(recovered.values())
+        log.close()
+
+        started = time.perf_counter()
+        log = TaskLog(directory)
+        recovered = log.recover()
+        print(f"Recuperacion desde snapshot: {len(recovered):,} tareas en {time.perf_counter() - started:.2f} s")
+        log.close()
+
+
+if __name__ == "__main__":
+    bench_persistence()
@@ -0,0 +1,82 @@
+"""Micro-benchmarks del repositorio en memoria.
+
+Uso:
+    python bench_repository.py
+
+Carga el repositorio hasta 10k, 100k y 1M tareas y compara el filtrado
+antiguo (recorrer todas las tareas) con las particiones por `done`.
+Tambien mide lo que cuestan las escrituras que mantienen las particiones
+(cambiar `done` y borrar) sobre las tareas mas antiguas y las mas
+recientes: deben costar lo mismo, sin depender del tamano ni de la
+posicion del id. Los borrados se reponen con tareas nuevas en el
+siguiente tamano.
+"""
+from time import perf_counter
+from timeit import timeit
+
+import repository
+from schemas import Task
+
+SIZES = [10_000, 100_000, 1_000_000]
+REPEAT = 5
+WRITE_REPEAT = 1_000
+
+
+def fill_repository(total: int) -> None:
+    missing = total - len(repository.list_tasks())
+    if missing <= 0:
+        return
+
+    for task_id in repository.reserve_task_ids(missing):
+        # Una de cada diez tareas queda hecha: el caso tipico de un dashboard.
+        task = Task(id=task_id, title=f"Tarea {task_id}", done=task_id % 10 == 0)
+        repository.save_task(task)
+
+
+def full_scan(done: bool):
+    return [task for task in repository.list_tasks() if task.done == done]
+
+
+def bench_done_filter() -> None:
+    print("GET /tasks?done=  (ms por llamada)")
+    print(f"{'tareas':>10} {'done':>6} {'scan':>10} {'particion':>10} {'mejora':>8}")
+    for size in SIZES:
+        fill_repository(size)
+        for done in (True, False):
+            assert full_scan(done) == repository.list_tasks_by_done(done)
+            scan_ms = timeit(lambda: full_scan(done), number=REPEAT) / REPEAT * 1000
+            partition_ms = timeit(lambda: repository.list_tasks_by_done(done), number=REPEAT) / REPEAT * 1000
+            print(f"{size:>10} {str(done):>6} {scan_ms:>10.2f} {partition_ms:>10.2f} {scan_ms / partition_ms:>7.1f}x")
+
+
+def toggle_done(task_id: int) -> None:
+    task = repository.get_task(task_id)
+    repository.replace_task(task_id, Task(id=task_id, title=task.title, done=not task.done))
+
+
+def time_deletes(task_ids) -> float:
+    started = perf_counter()
+    for task_id in task_ids:
+        repository.delete_task(task_id)
+    return (perf_counter() - started) / len(task_ids) * 1e6
+
+
+def bench_writes() -> None:
+    print("\nPUT done / DELETE  (us por llamada)")
+    print(f"{'tareas':>10} {'ids':>9} {'PUT done':>10} {'DELETE':>10}")
+    for size in SIZES:
+        fill_repository(size)
+        tasks = repository.list_tasks()
+        oldest = [task.id for task in tasks[:WRITE_REPEAT]]
+        newest = [task.id for task in tasks[-WRITE_REPEAT:]]
+        for label, task_ids in (("antiguos", oldest), ("recientes", newest)):
+            # Dos cambios por tarea: cada una termina como estaba.
+            toggle_us = timeit(lambda: [toggle_done(task_id) for task_id in task_ids], number=2)
+            toggle_us = toggle_us / (2 * len(task_ids)) * 1e6
+            delete_us = time_deletes(task_ids)
+            print(f"{size:>10} {label:>9} {toggle_us:>10.2f} {delete_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    bench_done_filter()
+    bench_writes()
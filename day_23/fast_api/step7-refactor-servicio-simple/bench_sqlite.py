@@ -0,0 +1,69 @@
+"""Benchmark: repositorio en memoria vs repositorio SQLite.
+
+Uso:
+    python bench_sqlite.py
+
+Usa una base de datos temporal; no toca `tasks.db`.
+"""
+import os
+import random
+import tempfile
+import time
+
+_database_dir = tempfile.TemporaryDirectory()
+os.environ["TASKS_SQLITE_PATH"] = os.path.join(_database_dir.name, "bench.db")
+
+import repository  # noqa: E402
+import repository_sqlite  # noqa: E402
+from schemas import Task  # noqa: E402
+
+TASKS = 100_000
+LOOKUPS = 20_000
+
+
+def timed(label: str, operations: int, function) -> None:
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {operations / elapsed:>12,.0f} ops/s")
+
+
+def bench_backend(name: str, backend) -> None:
+    print(name)
+    task_ids = backend.reserve_task_ids(TASKS)
+    tasks = [Task(id=task_id, title=f"Tarea {task_id}", done=task_id % 4 == 0) for task_id in task_ids]
+
+    def insert_all():
+        with backend.write_lock():
+            for task in tasks:
+                backend.save_task(task)
+
+    rng = random.Random(1)
+    sample = [rng.choice(tasks) for _ in range(LOOKUPS)]
+
+    def get_by_id():
+        for task in sample:
+            backend.get_task(task.id)
+
+    def find_by_title():
+        for task in sample:
+            backend.find_task_by_title(task.title.upper())
+
+    def page_by_done():
+        for task in sample[: LOOKUPS // 10]:
+            backend.list_tasks_page(after_id=task.id, limit=50, done=False)
+
+    def replace():
+        for task in sample[: LOOKUPS // 10]:
+            backend.replace_task(task.id, Task(id=task.id, title=task.title, done=not task.done))
+
+    timed(f"save_task x{TASKS}", TASKS, insert_all)
+    timed("get_task", LOOKUPS, get_by_id)
+    timed("find_task_by_title", LOOKUPS, find_by_title)
+    timed("list_tasks_page(done=False)", LOOKUPS // 10, page_by_done)
+    timed("replace_task", LOOKUPS // 10, replace)
+
+
+if __name__ == "__main__":
+    bench_backend("Memoria (repository.py)", repository)
+    bench_backend("SQLite (repository_sqlite.py)", repository_sqlite)
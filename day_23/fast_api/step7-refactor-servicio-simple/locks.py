@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+from threading import Condition, Lock, get_ident
+from typing import Iterator, Optional
+
+
+class ReadWriteLock:
+    """Muchos lectores a la vez o un solo escritor.
+
+    - Los escritores tienen preferencia: si hay uno esperando, no entran
+      lectores nuevos (evita que las escrituras se queden sin turno).
+    - El hilo que tiene la escritura puede volver a pedir lectura o escritura,
+      asi el servicio puede agrupar varias operaciones del repositorio.
+    """
+
+    def __init__(self) -> None:
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        if self._writer == get_ident():
+            yield
+            return
+
+        with self._condition:
+            while self._writer is not None or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        me = get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                self._writers_waiting += 1
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+                self._writers_waiting -= 1
+                self._writer = me
+                self._writer_depth = 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = None
+                    self._condition.notify_all()
@@ -1,16 +1,24 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from fastapi import FastAPI, Response, status
+from fastapi import FastAPI, Query, Response, status
 
 import service
-from schemas import Task, TaskCreate, TaskUpdate
+from pagination import MAX_PAGE_SIZE
+from schemas import Task, TaskBatchResult, TaskBatchUpdate, TaskCreate, TaskPage, TaskUpdate
 
 app = FastAPI(title="Step 7 - Refactor por capas")
 
 
-@app.get("/tasks", response_model=List[Task])
-def list_tasks(done: Optional[bool] = None):
-    return service.list_tasks(done)
+@app.get("/tasks", response_model=Union[TaskPage, List[Task]])
+def list_tasks(
+    done: Optional[bool] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    # Sin limit ni cursor se mantiene la respuesta clasica (lista completa).
+    if limit is None and cursor is None:
+        return service.list_tasks(done)
+    return service.list_tasks_page(done, limit, cursor)
 
 
 @app.post("/tasks", response_model=Task, status_code=status.HTTP_201_CREATED)
@@ -18,6 +26,21 @@ def create_task(payload: TaskCreate):
     return service.create_task(payload)
 
 
+@app.post("/tasks:batch", response_model=List[TaskBatchResult])
+def create_tasks_batch(payload: List[TaskCreate]):
+    return service.create_tasks_batch(payload)
+
+
+@app.patch("/tasks:batch", response_model=List[TaskBatchResult])
+def update_tasks_batch(payload: List[TaskBatchUpdate]):
+    return service.update_tasks_batch(payload)
+
+
+@app.delete("/tasks:batch", response_model=List[TaskBatchResult])
+def delete_tasks_batch(task_ids: List[int]):
+    return service.delete_tasks_batch(task_ids)
+
+
 @app.put("/tasks/{task_id}", response_model=Task)
 def update_task(task_id: int, payload: TaskUpdate):
     return service.update_task(task_id, payload)
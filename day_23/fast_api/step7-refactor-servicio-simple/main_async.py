@@ -0,0 +1,62 @@
+from contextlib import asynccontextmanager
+from typing import List, Optional, Union
+
+from fastapi import FastAPI, Query, Response, status
+
+import service_async
+from pagination import MAX_PAGE_SIZE
+from schemas import Task, TaskBatchResult, TaskBatchUpdate, TaskCreate, TaskPage, TaskUpdate
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await service_async.startup()
+    yield
+    await service_async.shutdown()
+
+
+# Misma API que main.py, pero con rutas `async def`: no ocupan un hilo del
+# threadpool por peticion, todo corre en el event loop.
+app = FastAPI(title="Step 7 - Refactor por capas (async)", lifespan=lifespan)
+
+
+@app.get("/tasks", response_model=Union[TaskPage, List[Task]])
+async def list_tasks(
+    done: Optional[bool] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    if limit is None and cursor is None:
+        return await service_async.list_tasks(done)
+    return await service_async.list_tasks_page(done, limit, cursor)
+
+
+@app.post("/tasks", response_model=Task, status_code=status.HTTP_201_CREATED)
+async def create_task(payload: TaskCreate):
+    return await service_async.create_task(payload)
+
+
+@app.post("/tasks:batch", response_model=List[TaskBatchResult])
+async def create_tasks_batch(payload: List[TaskCreate]):
+    return await service_async.create_tasks_batch(payload)
+
+
+@app.patch("/tasks:batch", response_model=List[TaskBatchResult])
+async def update_tasks_batch(payload: List[TaskBatchUpdate]):
+    return await service_async.update_tasks_batch(payload)
+
+
+@app.delete("/tasks:batch", response_model=List[TaskBatchResult])
+async def delete_tasks_batch(task_ids: List[int]):
+    return await service_async.delete_tasks_batch(task_ids)
+
+
+@app.put("/tasks/{task_id}", response_model=Task)
+async def update_task(task_id: int, payload: TaskUpdate):
+    return await service_async.update_task(task_id, payload)
+
+
+@app.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_task(task_id: int):
+    await service_async.delete_task(task_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,23 @@
+"""Tamanos de pagina y cursores keyset, comunes a service.py y service_async.py.
+
+Sin efectos al importar: service.py elige su repositorio (y puede crear la
+base SQLite) al importarse, y la variante async no debe depender de eso.
+"""
+import base64
+import binascii
+
+from fastapi import HTTPException, status
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(task_id: int) -> str:
+    return base64.urlsafe_b64encode(str(task_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="cursor invalido")
@@ -0,0 +1,192 @@
+"""Repositorio asincrono de tareas.
+
+`AsyncTaskRepository` define el contrato que espera `service_async.py`.
+Hay dos implementaciones:
+
+- `InMemoryTaskRepository`: reutiliza los indices del `repository.py` sincrono.
+- `SQLiteTaskRepository`: guarda las tareas en SQLite usando aiosqlite, con
+  el mismo esquema que `repository_sqlite.py` (`sqlite_schema.py`). Los ids
+  salen de la tabla `task_id_sequence`, asi varios procesos pueden
+  compartir la misma base sin repetir ids.
+"""
+from typing import List, Optional, Protocol
+
+import aiosqlite
+
+import repository
+from schemas import Task
+from sqlite_schema import (
+    DELETE_TASK,
+    INSERT_SEQUENCE,
+    RESERVE_IDS,
+    SCHEMA,
+    SEED_TASKS,
+    SELECT_ALL,
+    SELECT_BY_DONE,
+    SELECT_BY_ID,
+    SELECT_BY_TITLE_KEY,
+    SELECT_LAST_ID,
+    SELECT_PAGE,
+    SELECT_PAGE_BY_DONE,
+    UPDATE_TASK,
+    UPSERT_TASK,
+)
+
+
+class AsyncTaskRepository(Protocol):
+    async def list_tasks(self, done: Optional[bool] = None) -> List[Task]: ...
+
+    async def list_tasks_page(self, after_id: int, limit: int, done: Optional[bool] = None) -> List[Task]: ...
+
+    async def get_task(self, task_id: int) -> Optional[Task]: ...
+
+    async def find_task_by_title(self, title: str) -> Optional[Task]: ...
+
+    async def next_task_id(self) -> int: ...
+
+    async def reserve_task_ids(self, count: int) -> range: ...
+
+    async def save_task(self, task: Task) -> Task: ...
+
+    async def replace_task(self, task_id: int, updated_task: Task) -> Task: ...
+
+    async def delete_task(self, task_id: int) -> bool: ...
+
+    async def close(self) -> None: ...
+
+
+class InMemoryTaskRepository:
+    """Todas las operaciones son O(1) u O(log n) en memoria: no hace falta un hilo aparte."""
+
+    async def list_tasks(self, done: Optional[bool] = None) -> List[Task]:
+        if done is None:
+            return repository.list_tasks()
+        return repository.list_tasks_by_done(done)
+
+    async def list_tasks_page(self, after_id: int, limit: int, done: Optional[bool] = None) -> List[Task]:
+        return repository.list_tasks_page(after_id=after_id, limit=limit, done=done)
+
+    async def get_task(self, task_id: int) -> Optional[Task]:
+        return repository.get_task(task_id)
+
+    async def find_task_by_title(self, title: str) -> Optional[Task]:
+        return repository.find_task_by_title(title)
+
+    async def next_task_id(self) -> int:
+        return repository.next_task_id()
+
+    async def reserve_task_ids(self, count: int) -> range:
+        return repository.reserve_task_ids(count)
+
+    async def save_task(self, task: Task) -> Task:
+        return repository.save_task(task)
+
+    async def replace_task(self, task_id: int, updated_task: Task) -> Task:
+        return repository.replace_task(task_id, updated_task)
+
+    async def delete_task(self, task_id: int) -> bool:
+        return repository.delete_task(task_id)
+
+    async def close(self) -> None:
+        return None
+
+
+def _row_to_task(row) -> Task:
+    return Task(id=row[0], title=row[1], done=bool(row[2]))
+
+
+def _task_params(task: Task) -> tuple:
+    return (task.id, task.title, task.title.casefold(), int(task.done))
+
+
+class SQLiteTaskRepository:
+    """Repositorio sobre SQLite. Usar `await SQLiteTaskRepository.connect(path)`."""
+
+    def __init__(self, connection: aiosqlite.Connection) -> None:
+        self._connection = connection
+
+    @classmethod
+    async def connect(cls, path: str) -> "SQLiteTaskRepository":
+        connection = await aiosqlite.connect(path)
+        await connection.execute("PRAGMA journal_mode=WAL")
+        await connection.execute("PRAGMA synchronous=NORMAL")
+        await connection.execute("PRAGMA busy_timeout=5000")
+        await connection.executescript(SCHEMA)
+        # Como en repository_sqlite: solo el primer proceso que abre la base
+        # crea la secuencia de ids e inserta las tareas de ejemplo.
+        await connection.execute("BEGIN IMMEDIATE")
+        try:
+            async with connection.execute(SELECT_LAST_ID) as cursor:
+                sequence = await cursor.fetchone()
+            if sequence is None:
+                await connection.executemany(UPSERT_TASK, [_task_params(task) for task in SEED_TASKS])
+                await connection.execute(INSERT_SEQUENCE, (max(task.id for task in SEED_TASKS),))
+            await connection.commit()
+        except BaseException:
+            await connection.rollback()
+            raise
+        return cls(connection)
+
+    async def _fetch_tasks(self, query: str, params: tuple) -> List[Task]:
+        async with self._connection.execute(query, params) as cursor:
+            return [_row_to_task(row) for row in await cursor.fetchall()]
+
+    async def _fetch_task(self, query: str, params: tuple) -> Optional[Task]:
+        async with self._connection.execute(query, params) as cursor:
+            row = await cursor.fetchone()
+        return _row_to_task(row) if row is not None else None
+
+    async def list_tasks(self, done: Optional[bool] = None) -> List[Task]:
+        if done is None:
+            return await self._fetch_tasks(SELECT_ALL, ())
+        return await self._fetch_tasks(SELECT_BY_DONE, (int(done),))
+
+    async def list_tasks_page(self, after_id: int, limit: int, done: Optional[bool] = None) -> List[Task]:
+        if done is None:
+            return await self._fetch_tasks(SELECT_PAGE, (after_id, limit))
+        return await self._fetch_tasks(SELECT_PAGE_BY_DONE, (int(done), after_id, limit))
+
+    async def get_task(self, task_id: int) -> Optional[Task]:
+        return await self._fetch_task(SELECT_BY_ID, (task_id,))
+
+    async def find_task_by_title(self, title: str) -> Optional[Task]:
+        return await self._fetch_task(SELECT_BY_TITLE_KEY, (title.casefold(),))
+
+    async def next_task_id(self) -> int:
+        return (await self.reserve_task_ids(1)).start
+
+    async def reserve_task_ids(self, count: int) -> range:
+        """Reserva los ids en `task_id_sequence`, comun a todos los procesos que abren la base."""
+        if count < 1:
+            raise ValueError("count debe ser mayor que 0")
+
+        # Una sola sentencia lee y avanza la secuencia con la base bloqueada
+        # para escritura: dos procesos nunca reciben el mismo id.
+        rows = await self._connection.execute_fetchall(RESERVE_IDS, (count,))
+        await self._connection.commit()
+        (last_id,) = rows[0]
+        return range(last_id - count + 1, last_id + 1)
+
+    async def save_task(self, task: Task) -> Task:
+        # Upsert por id: un titulo repetido falla por el indice UNIQUE en
+        # vez de borrar la otra fila (como haria INSERT OR REPLACE).
+        await self._connection.execute(UPSERT_TASK, _task_params(task))
+        await self._connection.commit()
+        return task
+
+    async def replace_task(self, task_id: int, updated_task: Task) -> Task:
+        cursor = await self._connection.execute(
+            UPDATE_TASK, (updated_task.title, updated_task.title.casefold(), int(updated_task.done), task_id)
+        )
+        await self._connection.commit()
+        if cursor.rowcount == 0:
+            raise ValueError("Task no encontrada")
+        return updated_task
+
+    async def delete_task(self, task_id: int) -> bool:
+        cursor = await self._connection.execute(DELETE_TASK, (task_id,))
+        await self._connection.commit()
+        return cursor.rowcount > 0
+
+    async def close(self) -> None:
+        await self._connection.close()
@@ -1,38 +1,130 @@
-from typing import List, Optional
+import os
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException, status
 
-import repository
-from schemas import Task, TaskCreate, TaskUpdate
+from pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from schemas import Task, TaskBatchResult, TaskBatchUpdate, TaskCreate, TaskPage, TaskUpdate
+
+# TASKS_BACKEND=sqlite cambia el repositorio en memoria por el de SQLite:
+# ambos exponen las mismas funciones.
+if os.getenv("TASKS_BACKEND", "memory") == "sqlite":
+    import repository_sqlite as repository
+else:
+    import repository
 
 
 def list_tasks(done: Optional[bool] = None) -> List[Task]:
-    tasks = repository.list_tasks()
     if done is None:
-        return tasks
-    return [task for task in tasks if task.done == done]
+        return repository.list_tasks()
+    return repository.list_tasks_by_done(done)
+
+
+def list_tasks_page(done: Optional[bool] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> TaskPage:
+    limit = limit or DEFAULT_PAGE_SIZE
+    after_id = decode_cursor(cursor) if cursor else 0
+
+    # Pedimos una tarea de mas para saber si existe una pagina siguiente.
+    tasks = repository.list_tasks_page(after_id=after_id, limit=limit + 1, done=done)
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1].id)
+    return TaskPage(items=tasks, next_cursor=next_cursor)
 
 
 def create_task(payload: TaskCreate) -> Task:
-    duplicated = any(task.title.lower() == payload.title.lower() for task in repository.list_tasks())
-    if duplicated:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Ya existe una tarea con ese titulo")
+    with repository.write_lock():
+        if repository.find_task_by_title(payload.title) is not None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Ya existe una tarea con ese titulo")
 
-    task = Task(id=repository.next_task_id(), title=payload.title, done=False)
-    return repository.save_task(task)
+        task = Task(id=repository.next_task_id(), title=payload.title, done=False)
+        return repository.save_task(task)
 
 
 def update_task(task_id: int, payload: TaskUpdate) -> Task:
-    task = repository.get_task(task_id)
-    if task is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada")
+    with repository.write_lock():
+        task = repository.get_task(task_id)
+        if task is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada")
+
+        if payload.title is not None:
+            duplicated = repository.find_task_by_title(payload.title)
+            if duplicated is not None and duplicated.id != task_id:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Ya existe una tarea con ese titulo")
 
-    data = payload.model_dump(exclude_none=True) if hasattr(payload, "model_dump") else payload.dict(exclude_none=True)
-    updated_task = task.model_copy(update=data) if hasattr(task, "model_copy") else task.copy(update=data)
-    return repository.replace_task(task_id, updated_task)
+        if hasattr(payload, "model_dump"):
+            data = payload.model_dump(exclude_none=True)
+        else:
+            data = payload.dict(exclude_none=True)
+        updated_task = task.model_copy(update=data) if hasattr(task, "model_copy") else task.copy(update=data)
+        return repository.replace_task(task_id, updated_task)
 
 
 def delete_task(task_id: int) -> None:
     deleted = repository.delete_task(task_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada")
+
+
+def create_tasks_batch(payloads: List[TaskCreate]) -> List[TaskBatchResult]:
+    with repository.write_lock():
+        results: List[TaskBatchResult] = []
+        accepted: List[Tuple[int, TaskCreate]] = []
+        seen_titles = set()
+
+        # Una sola pasada detecta duplicados dentro del lote y contra el repositorio.
+        for index, payload in enumerate(payloads):
+            title_key = payload.title.casefold()
+            if title_key in seen_titles or repository.find_task_by_title(payload.title) is not None:
+                results.append(
+                    TaskBatchResult(
+                        index=index,
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Ya existe una tarea con ese titulo",
+                    )
+                )
+                continue
+            seen_titles.add(title_key)
+            accepted.append((index, payload))
+
+        if accepted:
+            task_ids = repository.reserve_task_ids(len(accepted))
+            for task_id, (index, payload) in zip(task_ids, accepted):
+                task = repository.save_task(Task(id=task_id, title=payload.title, done=False))
+                results.append(TaskBatchResult(index=index, status_code=status.HTTP_201_CREATED, task=task))
+
+        results.sort(key=lambda result: result.index)
+        return results
+
+
+def update_tasks_batch(payloads: List[TaskBatchUpdate]) -> List[TaskBatchResult]:
+    results: List[TaskBatchResult] = []
+    seen_ids = set()
+    for index, payload in enumerate(payloads):
+        if payload.id in seen_ids:
+            results.append(
+                TaskBatchResult(index=index, status_code=status.HTTP_409_CONFLICT, detail="Tarea repetida en el lote")
+            )
+            continue
+        seen_ids.add(payload.id)
+
+        try:
+            task = update_task(payload.id, payload)
+        except HTTPException as exc:
+            results.append(TaskBatchResult(index=index, status_code=exc.status_code, detail=str(exc.detail)))
+            continue
+        results.append(TaskBatchResult(index=index, status_code=status.HTTP_200_OK, task=task))
+    return results
+
+
+def delete_tasks_batch(task_ids: List[int]) -> List[TaskBatchResult]:
+    results: List[TaskBatchResult] = []
+    for index, task_id in enumerate(task_ids):
+        if repository.delete_task(task_id):
+            results.append(TaskBatchResult(index=index, status_code=status.HTTP_204_NO_CONTENT))
+        else:
+            results.append(
+                TaskBatchResult(index=index, status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada")
+            )
+    return results
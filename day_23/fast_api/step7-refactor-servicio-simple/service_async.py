@@ -0,0 +1,139 @@
+import asyncio
+import os
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from repository_async import AsyncTaskRepository, InMemoryTaskRepository, SQLiteTaskRepository
+from schemas import Task, TaskBatchResult, TaskBatchUpdate, TaskCreate, TaskPage, TaskUpdate
+
+_repository: AsyncTaskRepository = InMemoryTaskRepository()
+# Entre dos `await` puede colarse otra peticion: el lock hace atomicas
+# las comprobaciones de duplicados + escritura.
+_write_lock = asyncio.Lock()
+
+
+async def startup() -> None:
+    """Elige el repositorio segun TASKS_BACKEND (memory | sqlite)."""
+    global _repository
+    if os.getenv("TASKS_BACKEND", "memory") == "sqlite":
+        _repository = await SQLiteTaskRepository.connect(os.getenv("TASKS_SQLITE_PATH", "tasks.db"))
+    else:
+        _repository = InMemoryTaskRepository()
+
+
+async def shutdown() -> None:
+    await _repository.close()
+
+
+async def list_tasks(done: Optional[bool] = None) -> List[Task]:
+    return await _repository.list_tasks(done)
+
+
+async def list_tasks_page(
+    done: Optional[bool] = None, limit: Optional[int] = None, cursor: Optional[str] = None
+) -> TaskPage:
+    limit = limit or DEFAULT_PAGE_SIZE
+    after_id = decode_cursor(cursor) if cursor else 0
+
+    tasks = await _repository.list_tasks_page(after_id=after_id, limit=limit + 1, done=done)
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1].id)
+    return TaskPage(items=tasks, next_cursor=next_cursor)
+
+
+async def create_task(payload: TaskCreate) -> Task:
+    async with _write_lock:
+        if await _repository.find_task_by_title(payload.title) is not None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Ya existe una tarea con ese titulo")
+
+        task = Task(id=await _repository.next_task_id(), title=payload.title, done=False)
+        return await _repository.save_task(task)
+
+
+async def update_task(task_id: int, payload: TaskUpdate) -> Task:
+    async with _write_lock:
+        task = await _repository.get_task(task_id)
+        if task is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada")
+
+        if payload.title is not None:
+            duplicated = await _repository.find_task_by_title(payload.title)
+            if duplicated is not None and duplicated.id != task_id:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Ya existe una tarea con ese titulo")
+
+        data = payload.model_dump(exclude_none=True)
+        updated_task = task.model_copy(update=data)
+        return await _repository.replace_task(task_id, updated_task)
+
+
+async def delete_task(task_id: int) -> None:
+    deleted = await _repository.delete_task(task_id)
+    if not deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada")
+
+
+async def create_tasks_batch(payloads: List[TaskCreate]) -> List[TaskBatchResult]:
+    async with _write_lock:
+        results: List[TaskBatchResult] = []
+        accepted: List[Tuple[int, TaskCreate]] = []
+        seen_titles = set()
+
+        # Una sola pasada detecta duplicados dentro del lote y contra el repositorio.
+        for index, payload in enumerate(payloads):
+            title_key = payload.title.casefold()
+            if title_key in seen_titles or await _repository.find_task_by_title(payload.title) is not None:
+                results.append(
+                    TaskBatchResult(
+                        index=index,
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Ya existe una tarea con ese titulo",
+                    )
+                )
+                continue
+            seen_titles.add(title_key)
+            accepted.append((index, payload))
+
+        if accepted:
+            task_ids = await _repository.reserve_task_ids(len(accepted))
+            for task_id, (index, payload) in zip(task_ids, accepted):
+                task = await _repository.save_task(Task(id=task_id, title=payload.title, done=False))
+                results.append(TaskBatchResult(index=index, status_code=status.HTTP_201_CREATED, task=task))
+
+        results.sort(key=lambda result: result.index)
+        return results
+
+
+async def update_tasks_batch(payloads: List[TaskBatchUpdate]) -> List[TaskBatchResult]:
+    results: List[TaskBatchResult] = []
+    seen_ids = set()
+    for index, payload in enumerate(payloads):
+        if payload.id in seen_ids:
+            results.append(
+                TaskBatchResult(index=index, status_code=status.HTTP_409_CONFLICT, detail="Tarea repetida en el lote")
+            )
+            continue
+        seen_ids.add(payload.id)
+
+        try:
+            task = await update_task(payload.id, payload)
+        except HTTPException as exc:
+            results.append(TaskBatchResult(index=index, status_code=exc.status_code, detail=str(exc.detail)))
+            continue
+        results.append(TaskBatchResult(index=index, status_code=status.HTTP_200_OK, task=task))
+    return results
+
+
+async def delete_tasks_batch(task_ids: List[int]) -> List[TaskBatchResult]:
+    results: List[TaskBatchResult] = []
+    for index, task_id in enumerate(task_ids):
+        if await _repository.delete_task(task_id):
+            results.append(TaskBatchResult(index=index, status_code=status.HTTP_204_NO_CONTENT))
+        else:
+            results.append(
+                TaskBatchResult(index=index, status_code=status.HTTP_404_NOT_FOUND, detail="Tarea no encontrada")
+            )
+    return results
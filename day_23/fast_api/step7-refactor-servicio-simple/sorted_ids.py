@@ -0,0 +1,64 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
+
+
+class SortedIds:
+    """Ids ordenados en bloques de como mucho `block_size` elementos.
+
+    Con una sola lista, insertar o borrar un id del principio mueve todos
+    los demas: O(n). Aqui solo se mueve un bloque (O(block_size)) y el
+    bloque se encuentra por biseccion sobre el ultimo id de cada bloque.
+    Recorrer en orden sigue siendo recorrer listas de Python (en C).
+    """
+
+    def __init__(self, task_ids: Iterable[int] = (), block_size: int = 1024) -> None:
+        self._block_size = block_size
+        ordered = sorted(task_ids)
+        self._blocks: List[List[int]] = [
+            ordered[start:start + block_size] for start in range(0, len(ordered), block_size)
+        ]
+        self._maxes: List[int] = [block[-1] for block in self._blocks]
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(self._blocks)
+
+    def add(self, task_id: int) -> None:
+        if not self._blocks:
+            self._blocks.append([task_id])
+            self._maxes.append(task_id)
+            return
+
+        # Los ids nuevos son monotonos: casi siempre van al ultimo bloque.
+        position = min(bisect_left(self._maxes, task_id), len(self._blocks) - 1)
+        block = self._blocks[position]
+        insort(block, task_id)
+        self._maxes[position] = block[-1]
+        if len(block) > 2 * self._block_size:
+            self._blocks.insert(position + 1, block[self._block_size:])
+            del block[self._block_size:]
+            self._maxes.insert(position, block[-1])
+
+    def discard(self, task_id: int) -> None:
+        position = bisect_left(self._maxes, task_id)
+        if position == len(self._blocks):
+            return
+        block = self._blocks[position]
+        index = bisect_left(block, task_id)
+        if index == len(block) or block[index] != task_id:
+            return
+        del block[index]
+        if block:
+            self._maxes[position] = block[-1]
+        else:
+            del self._blocks[position]
+            del self._maxes[position]
+
+    def after(self, task_id: int) -> Iterator[int]:
+        """Ids mayores que `task_id`, en orden."""
+        position = bisect_right(self._maxes, task_id)
+        if position == len(self._blocks):
+            return iter(())
+        block = self._blocks[position]
+        first = islice(block, bisect_right(block, task_id), None)
+        return chain(first, chain.from_iterable(islice(self._blocks, position + 1, None)))
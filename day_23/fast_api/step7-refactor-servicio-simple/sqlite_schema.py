@@ -0,0 +1,45 @@
+"""Esquema y sentencias SQL de las tareas en SQLite.
+
+Lo comparten repository_sqlite.py (sqlite3) y repository_async.py
+(aiosqlite), asi los dos backends pueden abrir la misma base de datos.
+Importar este modulo no abre ninguna conexion.
+"""
+from schemas import Task
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_title_key ON tasks (title_key);
+CREATE INDEX IF NOT EXISTS idx_tasks_done_id_title ON tasks (done, id, title);
+CREATE TABLE IF NOT EXISTS task_id_sequence (
+    singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+    last_id INTEGER NOT NULL
+);
+"""
+
+SEED_TASKS = [
+    Task(id=1, title="Repasar status codes", done=False),
+    Task(id=2, title="Probar endpoint en Swagger", done=True),
+]
+
+SELECT_ALL = "SELECT id, title, done FROM tasks ORDER BY id"
+SELECT_BY_DONE = "SELECT id, title, done FROM tasks WHERE done = ? ORDER BY id"
+SELECT_PAGE = "SELECT id, title, done FROM tasks WHERE id > ? ORDER BY id LIMIT ?"
+SELECT_PAGE_BY_DONE = "SELECT id, title, done FROM tasks WHERE done = ? AND id > ? ORDER BY id LIMIT ?"
+SELECT_BY_ID = "SELECT id, title, done FROM tasks WHERE id = ?"
+SELECT_BY_TITLE_KEY = "SELECT id, title, done FROM tasks WHERE title_key = ?"
+SELECT_LAST_ID = "SELECT last_id FROM task_id_sequence WHERE singleton = 1"
+UPDATE_LAST_ID = "UPDATE task_id_sequence SET last_id = ? WHERE singleton = 1"
+UPSERT_TASK = (
+    "INSERT INTO tasks (id, title, title_key, done) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET title = excluded.title, title_key = excluded.title_key, done = excluded.done"
+)
+UPDATE_TASK = "UPDATE tasks SET title = ?, title_key = ?, done = ? WHERE id = ?"
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+INSERT_SEQUENCE = "INSERT INTO task_id_sequence (singleton, last_id) VALUES (1, ?)"
+# Reserva `?` ids en una sola sentencia: leer y sumar no se pueden separar.
+RESERVE_IDS = "UPDATE task_id_sequence SET last_id = last_id + ? WHERE singleton = 1 RETURNING last_id"
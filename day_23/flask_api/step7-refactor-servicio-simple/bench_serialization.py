@@ -0,0 +1,49 @@
+"""Benchmark de serializacion de GET /tasks.
+
+Uso:
+    python bench_serialization.py
+
+Compara el camino antiguo (model_to_dict por objeto + jsonify con el
+provider por defecto) con PydanticJSONProvider.
+"""
+from timeit import timeit
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from json_provider import PydanticJSONProvider
+from schemas import Task
+
+SIZES = [1_000, 10_000, 100_000]
+REPEAT = 5
+
+
+def old_model_to_dict(model):
+    if hasattr(model, "model_dump"):
+        return model.model_dump()
+    return model.dict()
+
+
+def bench_serialization() -> None:
+    old_app = Flask("old")
+    old_app.json = DefaultJSONProvider(old_app)
+    new_app = Flask("new")
+    new_app.json = PydanticJSONProvider(new_app)
+
+    print("Serializar lista de tareas (tareas/segundo)")
+    print(f"{'tareas':>10} {'antiguo':>14} {'nuevo':>14} {'mejora':>8}")
+    for size in SIZES:
+        tasks = [Task(id=task_id, title=f"Tarea {task_id}", done=task_id % 2 == 0) for task_id in range(1, size + 1)]
+
+        with old_app.app_context():
+            old_seconds = timeit(lambda: old_app.json.response([old_model_to_dict(task) for task in tasks]), number=REPEAT)
+        with new_app.app_context():
+            new_seconds = timeit(lambda: new_app.json.response(tasks), number=REPEAT)
+
+        old_rate = size * REPEAT / old_seconds
+        new_rate = size * REPEAT / new_seconds
+        print(f"{size:>10} {old_rate:>14,.0f} {new_rate:>14,.0f} {new_rate / old_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    bench_serialization()
@@ -0,0 +1,79 @@
+"""JSON provider de Flask que serializa modelos pydantic directamente a bytes.
+
+La rama pydantic v1/v2 se resuelve una sola vez al importar el modulo,
+no en cada objeto de cada respuesta. Tambien da los validadores de listas
+que usan los endpoints por lotes, para que main.py no dependa de v2.
+"""
+import json
+from typing import Any, Callable, Iterable, List, Optional
+
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+
+from schemas import Task
+
+try:
+    from pydantic import TypeAdapter
+except ImportError:  # pydantic v1
+    from pydantic import parse_obj_as
+
+    TypeAdapter = None
+
+
+if TypeAdapter is not None:
+    _task_list_adapter = TypeAdapter(List[Task])
+
+    def model_to_dict(model: BaseModel) -> dict:
+        return model.model_dump()
+
+    def dump_model(model: BaseModel) -> bytes:
+        return model.model_dump_json().encode()
+
+    def dump_tasks(tasks: Iterable[Task]) -> bytes:
+        # El serializador de pydantic-core escribe el JSON sin crear dicts intermedios.
+        return _task_list_adapter.dump_json(tasks)
+
+    def list_parser(item_type: Any) -> Callable[[Any], list]:
+        # Un solo TypeAdapter valida el lote completo de una vez.
+        return TypeAdapter(List[item_type]).validate_python
+
+else:
+
+    def model_to_dict(model: BaseModel) -> dict:
+        return model.dict()
+
+    def dump_model(model: BaseModel) -> bytes:
+        return model.json().encode()
+
+    def dump_tasks(tasks: Iterable[Task]) -> bytes:
+        return json.dumps([task.dict() for task in tasks]).encode()
+
+    def list_parser(item_type: Any) -> Callable[[Any], list]:
+        return lambda payload: parse_obj_as(List[item_type], payload)
+
+
+class PydanticJSONProvider(DefaultJSONProvider):
+    """Usa el camino rapido para modelos y listas de Task; el resto va al provider por defecto."""
+
+    sort_keys = False
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, BaseModel):
+            return model_to_dict(o)
+        return DefaultJSONProvider.default(o)
+
+    @staticmethod
+    def dump_fast(obj: Any) -> Optional[bytes]:
+        if isinstance(obj, BaseModel):
+            return dump_model(obj)
+        if isinstance(obj, list) and all(isinstance(item, Task) for item in obj):
+            return dump_tasks(obj)
+        return None
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = self.dump_fast(obj)
+        if body is None:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -1,19 +1,19 @@
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from pydantic import ValidationError
 
 import service
-from schemas import TaskCreate, TaskUpdate
+from json_provider import PydanticJSONProvider, dump_model, list_parser
+from schemas import Task, TaskBatchUpdate, TaskCreate, TaskUpdate
 
 app = Flask(__name__)
 app.config["JSON_SORT_KEYS"] = False
+app.json = PydanticJSONProvider(app)
 
-
-def model_to_dict(model):
-    if hasattr(model, "model_dump"):
-        return model.model_dump()
-    return model.dict()
+parse_create_batch = list_parser(TaskCreate)
+parse_update_batch = list_parser(TaskBatchUpdate)
+parse_delete_batch = list_parser(int)
 
 
 def parse_bool_query(name: str) -> Optional[bool]:
@@ -30,6 +30,21 @@ def parse_bool_query(name: str) -> Optional[bool]:
     raise service.AppError(status_code=400, detail=f"{name} debe ser true o false")
 
 
+def parse_int_query(name: str, minimum: int, maximum: int) -> Optional[int]:
+    raw = request.args.get(name)
+    if raw is None:
+        return None
+
+    try:
+        value = int(raw)
+    except ValueError:
+        raise service.AppError(status_code=400, detail=f"{name} debe ser un numero entero")
+
+    if not minimum <= value <= maximum:
+        raise service.AppError(status_code=400, detail=f"{name} debe estar entre {minimum} y {maximum}")
+    return value
+
+
 def parse_payload(model_cls):
     payload = request.get_json(silent=True)
     if payload is None:
@@ -41,6 +56,36 @@ def parse_payload(model_cls):
         raise service.AppError(status_code=422, detail=exc.errors())
 
 
+def parse_batch_payload(parse_list: Callable[[Any], list]):
+    payload = request.get_json(silent=True)
+    if payload is None:
+        raise service.AppError(status_code=400, detail="Body JSON requerido")
+
+    try:
+        return parse_list(payload)
+    except ValidationError as exc:
+        raise service.AppError(status_code=422, detail=exc.errors())
+
+
+def wants_ndjson() -> bool:
+    best = request.accept_mimetypes.best_match(["application/json", "application/x-ndjson"])
+    return best == "application/x-ndjson"
+
+
+def stream_json_array(tasks: Iterable[Task]) -> Iterator[bytes]:
+    yield b"["
+    separator = b""
+    for task in tasks:
+        yield separator + dump_model(task)
+        separator = b","
+    yield b"]"
+
+
+def stream_ndjson(tasks: Iterable[Task]) -> Iterator[bytes]:
+    for task in tasks:
+        yield dump_model(task) + b"\n"
+
+
 @app.errorhandler(service.AppError)
 def handle_app_error(error: service.AppError):
     return jsonify({"detail": error.detail}), error.status_code
@@ -49,22 +94,54 @@ def handle_app_error(error: service.AppError):
 @app.get("/tasks")
 def list_tasks():
     done = parse_bool_query("done")
-    tasks = service.list_tasks(done)
-    return jsonify([model_to_dict(task) for task in tasks])
+    limit = parse_int_query("limit", 1, service.MAX_PAGE_SIZE)
+    cursor = request.args.get("cursor")
+
+    # Modo streaming: se envia tarea a tarea, la memoria no crece con la coleccion.
+    if wants_ndjson():
+        return Response(stream_ndjson(service.iter_tasks(done)), mimetype="application/x-ndjson")
+    if parse_bool_query("stream"):
+        return Response(stream_json_array(service.iter_tasks(done)), mimetype="application/json")
+
+    # Sin limit ni cursor se mantiene la respuesta clasica (lista completa).
+    if limit is None and cursor is None:
+        tasks = service.list_tasks(done)
+        return jsonify(tasks)
+
+    page = service.list_tasks_page(done, limit, cursor)
+    return jsonify(page)
 
 
 @app.post("/tasks")
 def create_task():
     payload = parse_payload(TaskCreate)
     task = service.create_task(payload)
-    return jsonify(model_to_dict(task)), 201
+    return jsonify(task), 201
+
+
+@app.post("/tasks:batch")
+def create_tasks_batch():
+    payloads = parse_batch_payload(parse_create_batch)
+    return jsonify(service.create_tasks_batch(payloads))
+
+
+@app.patch("/tasks:batch")
+def update_tasks_batch():
+    payloads = parse_batch_payload(parse_update_batch)
+    return jsonify(service.update_tasks_batch(payloads))
+
+
+@app.delete("/tasks:batch")
+def delete_tasks_batch():
+    task_ids = parse_batch_payload(parse_delete_batch)
+    return jsonify(service.delete_tasks_batch(task_ids))
 
 
 @app.put("/tasks/<int:task_id>")
 def update_task(task_id: int):
     payload = parse_payload(TaskUpdate)
     task = service.update_task(task_id, payload)
-    return jsonify(model_to_dict(task))
+    return jsonify(task)
 
 
 @app.delete("/tasks/<int:task_id>")
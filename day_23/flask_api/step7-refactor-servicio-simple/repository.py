@@ -1,44 +1,179 @@
-from typing import List, Optional
+from heapq import merge
+from itertools import islice
+from threading import Lock
+from typing import ContextManager, Dict, List, Optional
 
+import persistence
+from locks import ReadWriteLock
 from schemas import Task
+from sorted_ids import SortedIds
 
-_tasks: List[Task] = [
+_seed_tasks = [
     Task(id=1, title="Repasar status codes", done=False),
     Task(id=2, title="Probar endpoint con checks.http", done=True),
 ]
 
+# Con TASKS_DATA_DIR definido, las tareas sobreviven a reinicios: se
+# recuperan del snapshot + log y cada escritura se anade al log.
+_log = persistence.open_from_env()
+if _log is not None:
+    if _log.is_empty():
+        _log.recover()
+        for _seed_task in _seed_tasks:
+            _log.append_save(_seed_task)
+    else:
+        _seed_tasks = list(_log.recover().values())
+
+# Indexado por id: get/replace/delete en O(1).
+# Los dict de Python conservan el orden de insercion, asi que list_tasks()
+# sigue devolviendo las tareas en orden de creacion.
+_tasks: Dict[int, Task] = {task.id: task for task in _seed_tasks}
+
+# Contador monotono: se inicializa una sola vez con los datos iniciales y
+# nunca reutiliza ids, aunque se borren tareas. El lock evita que dos
+# peticiones concurrentes reciban el mismo id.
+_id_lock = Lock()
+_last_task_id = max(max(_tasks.keys(), default=0), _log.last_task_id if _log is not None else 0)
+
+# Lecturas en paralelo, escrituras de una en una: replace/delete/save no
+# pueden intercalarse y dejar los indices desincronizados.
+_lock = ReadWriteLock()
+
+
+def _title_key(title: str) -> str:
+    return title.casefold()
+
+
+# Indice secundario: titulo normalizado -> id. Permite detectar duplicados
+# en O(1) sin recorrer todas las tareas.
+_task_ids_by_title: Dict[str, int] = {_title_key(task.title): task.id for task in _tasks.values()}
+
+# Particiones por estado: ids ordenados de las tareas con done=True/False.
+# Como los ids son monotonos, ordenar por id equivale a orden de creacion,
+# y filtrar por `done` cuesta solo lo que mide el resultado. SortedIds
+# guarda los ids por bloques: cambiar `done` o borrar una tarea antigua no
+# desplaza toda la particion.
+_task_ids_by_done: Dict[bool, SortedIds] = {
+    done: SortedIds(task.id for task in _tasks.values() if task.done == done) for done in (True, False)
+}
+
+
+def _log_save(task: Task) -> None:
+    if _log is None:
+        return
+    _log.append_save(task)
+    if _log.snapshot_due:
+        _log.snapshot(_tasks.values())
+
+
+def _log_delete(task_id: int) -> None:
+    if _log is None:
+        return
+    _log.append_delete(task_id)
+    if _log.snapshot_due:
+        _log.snapshot(_tasks.values())
+
+
+def _add_to_done_partition(task: Task) -> None:
+    _task_ids_by_done[task.done].add(task.id)
+
+
+def _remove_from_done_partition(task: Task) -> None:
+    _task_ids_by_done[task.done].discard(task.id)
+
+
+def write_lock() -> ContextManager[None]:
+    """Permite al servicio hacer varias operaciones como una sola escritura atomica."""
+    return _lock.write()
+
 
 def list_tasks() -> List[Task]:
-    return _tasks
+    with _lock.read():
+        return list(_tasks.values())
+
+
+def list_tasks_by_done(done: bool) -> List[Task]:
+    with _lock.read():
+        return [_tasks[task_id] for task_id in _task_ids_by_done[done]]
+
+
+def list_tasks_page(after_id: int, limit: int, done: Optional[bool] = None) -> List[Task]:
+    """Keyset: devuelve hasta `limit` tareas con id > after_id, ordenadas por id."""
+    with _lock.read():
+        if done is None:
+            partitions = list(_task_ids_by_done.values())
+        else:
+            partitions = [_task_ids_by_done[done]]
+
+        # Cada particion esta ordenada: merge + islice solo recorre `limit` ids.
+        task_ids = merge(*(ids.after(after_id) for ids in partitions))
+        return [_tasks[task_id] for task_id in islice(task_ids, limit)]
 
 
 def get_task(task_id: int) -> Optional[Task]:
-    for task in _tasks:
-        if task.id == task_id:
-            return task
-    return None
+    with _lock.read():
+        return _tasks.get(task_id)
+
+
+def find_task_by_title(title: str) -> Optional[Task]:
+    with _lock.read():
+        task_id = _task_ids_by_title.get(_title_key(title))
+        if task_id is None:
+            return None
+        return _tasks.get(task_id)
 
 
 def next_task_id() -> int:
-    return max((task.id for task in _tasks), default=0) + 1
+    return reserve_task_ids(1).start
+
+
+def reserve_task_ids(count: int) -> range:
+    """Reserva `count` ids consecutivos de una vez (util para cargas masivas)."""
+    global _last_task_id
+    if count < 1:
+        raise ValueError("count debe ser mayor que 0")
+
+    with _id_lock:
+        first_id = _last_task_id + 1
+        _last_task_id += count
+    return range(first_id, first_id + count)
 
 
 def save_task(task: Task) -> Task:
-    _tasks.append(task)
-    return task
+    with _lock.write():
+        previous = _tasks.get(task.id)
+        if previous is not None:
+            _task_ids_by_title.pop(_title_key(previous.title), None)
+            _remove_from_done_partition(previous)
+        _tasks[task.id] = task
+        _task_ids_by_title[_title_key(task.title)] = task.id
+        _add_to_done_partition(task)
+        _log_save(task)
+        return task
 
 
 def replace_task(task_id: int, updated_task: Task) -> Task:
-    for index, task in enumerate(_tasks):
-        if task.id == task_id:
-            _tasks[index] = updated_task
-            return updated_task
-    raise ValueError("Task no encontrada")
+    with _lock.write():
+        task = _tasks.get(task_id)
+        if task is None:
+            raise ValueError("Task no encontrada")
+        # Asignar sobre una clave existente mantiene su posicion en el orden.
+        _tasks[task_id] = updated_task
+        _task_ids_by_title.pop(_title_key(task.title), None)
+        _task_ids_by_title[_title_key(updated_task.title)] = task_id
+        if task.done != updated_task.done:
+            _remove_from_done_partition(task)
+            _add_to_done_partition(updated_task)
+        _log_save(updated_task)
+        return updated_task
 
 
 def delete_task(task_id: int) -> bool:
-    task = get_task(task_id)
-    if task is None:
-        return False
-    _tasks.remove(task)
-    return True
+    with _lock.write():
+        task = _tasks.pop(task_id, None)
+        if task is None:
+            return False
+        _task_ids_by_title.pop(_title_key(task.title), None)
+        _remove_from_done_partition(task)
+        _log_delete(task_id)
+        return True
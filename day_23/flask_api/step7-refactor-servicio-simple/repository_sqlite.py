@@ -0,0 +1,186 @@
+"""Repositorio de tareas sobre SQLite (stdlib `sqlite3`).
+
+Mismas funciones que `repository.py`, asi `service.py` puede usar uno u
+otro segun la variable de entorno TASKS_BACKEND=sqlite. La base de datos
+se indica con TASKS_SQLITE_PATH (por defecto `tasks.db`).
+
+- Modo WAL: los lectores no bloquean al escritor ni al reves.
+- Una conexion por hilo; cada conexion cachea sus sentencias preparadas,
+  por eso todas las consultas son textos constantes con parametros `?`.
+- `title_key` guarda el titulo con casefold() y tiene indice UNIQUE: la
+  comprobacion de duplicados es una busqueda por indice. (SQLite `lower()`
+  solo entiende ASCII, por eso se normaliza en Python.)
+- `idx_tasks_done_id_title` cubre el filtrado por `done`: la consulta se
+  responde solo con el indice, sin tocar la tabla.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from schemas import Task
+
+DATABASE_PATH = os.getenv("TASKS_SQLITE_PATH", "tasks.db")
+STATEMENT_CACHE_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_title_key ON tasks (title_key);
+CREATE INDEX IF NOT EXISTS idx_tasks_done_id_title ON tasks (done, id, title);
+CREATE TABLE IF NOT EXISTS task_id_sequence (
+    singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+    last_id INTEGER NOT NULL
+);
+"""
+
+SEED_TASKS = [
+    Task(id=1, title="Repasar status codes", done=False),
+    Task(id=2, title="Probar endpoint con checks.http", done=True),
+]
+
+SELECT_ALL = "SELECT id, title, done FROM tasks ORDER BY id"
+SELECT_BY_DONE = "SELECT id, title, done FROM tasks WHERE done = ? ORDER BY id"
+SELECT_PAGE = "SELECT id, title, done FROM tasks WHERE id > ? ORDER BY id LIMIT ?"
+SELECT_PAGE_BY_DONE = "SELECT id, title, done FROM tasks WHERE done = ? AND id > ? ORDER BY id LIMIT ?"
+SELECT_BY_ID = "SELECT id, title, done FROM tasks WHERE id = ?"
+SELECT_BY_TITLE_KEY = "SELECT id, title, done FROM tasks WHERE title_key = ?"
+SELECT_LAST_ID = "SELECT last_id FROM task_id_sequence WHERE singleton = 1"
+UPDATE_LAST_ID = "UPDATE task_id_sequence SET last_id = ? WHERE singleton = 1"
+UPSERT_TASK = (
+    "INSERT INTO tasks (id, title, title_key, done) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET title = excluded.title, title_key = excluded.title_key, done = excluded.done"
+)
+UPDATE_TASK = "UPDATE tasks SET title = ?, title_key = ?, done = ? WHERE id = ?"
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+
+_local = threading.local()
+
+
+def _connect() -> sqlite3.Connection:
+    # isolation_level=None: autocommit; las transacciones se abren a mano en write_lock().
+    connection = sqlite3.connect(DATABASE_PATH, isolation_level=None, cached_statements=STATEMENT_CACHE_SIZE)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA busy_timeout=5000")
+    return connection
+
+
+def _connection() -> sqlite3.Connection:
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = _connect()
+        _local.connection = connection
+        _local.transaction_depth = 0
+    return connection
+
+
+def _row_to_task(row) -> Task:
+    return Task(id=row[0], title=row[1], done=bool(row[2]))
+
+
+def _task_params(task: Task) -> tuple:
+    return (task.id, task.title, task.title.casefold(), int(task.done))
+
+
+@contextmanager
+def write_lock() -> Iterator[None]:
+    """Transaccion BEGIN IMMEDIATE: las comprobaciones + escrituras del servicio son atomicas."""
+    connection = _connection()
+    if _local.transaction_depth:
+        _local.transaction_depth += 1
+        try:
+            yield
+        finally:
+            _local.transaction_depth -= 1
+        return
+
+    connection.execute("BEGIN IMMEDIATE")
+    _local.transaction_depth = 1
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    else:
+        connection.execute("COMMIT")
+    finally:
+        _local.transaction_depth = 0
+
+
+def _init_database() -> None:
+    connection = _connection()
+    connection.executescript(SCHEMA)
+    with write_lock():
+        if connection.execute(SELECT_LAST_ID).fetchone() is None:
+            connection.executemany(UPSERT_TASK, [_task_params(task) for task in SEED_TASKS])
+            last_id = max(task.id for task in SEED_TASKS)
+            connection.execute("INSERT INTO task_id_sequence (singleton, last_id) VALUES (1, ?)", (last_id,))
+
+
+_init_database()
+
+
+def list_tasks() -> List[Task]:
+    return [_row_to_task(row) for row in _connection().execute(SELECT_ALL)]
+
+
+def list_tasks_by_done(done: bool) -> List[Task]:
+    return [_row_to_task(row) for row in _connection().execute(SELECT_BY_DONE, (int(done),))]
+
+
+def list_tasks_page(after_id: int, limit: int, done: Optional[bool] = None) -> List[Task]:
+    if done is None:
+        rows = _connection().execute(SELECT_PAGE, (after_id, limit))
+    else:
+        rows = _connection().execute(SELECT_PAGE_BY_DONE, (int(done), after_id, limit))
+    return [_row_to_task(row) for row in rows]
+
+
+def get_task(task_id: int) -> Optional[Task]:
+    row = _connection().execute(SELECT_BY_ID, (task_id,)).fetchone()
+    return _row_to_task(row) if row is not None else None
+
+
+def find_task_by_title(title: str) -> Optional[Task]:
+    row = _connection().execute(SELECT_BY_TITLE_KEY, (title.casefold(),)).fetchone()
+    return _row_to_task(row) if row is not None else None
+
+
+def next_task_id() -> int:
+    return reserve_task_ids(1).start
+
+
+def reserve_task_ids(count: int) -> range:
+    """Reserva `count` ids consecutivos; la secuencia vive en la propia base de datos."""
+    if count < 1:
+        raise ValueError("count debe ser mayor que 0")
+
+    with write_lock():
+        connection = _connection()
+        (last_id,) = connection.execute(SELECT_LAST_ID).fetchone()
+        connection.execute(UPDATE_LAST_ID, (last_id + count,))
+    return range(last_id + 1, last_id + count + 1)
+
+
+def save_task(task: Task) -> Task:
+    _connection().execute(UPSERT_TASK, _task_params(task))
+    return task
+
+
+def replace_task(task_id: int, updated_task: Task) -> Task:
+    cursor = _connection().execute(
+        UPDATE_TASK, (updated_task.title, updated_task.title.casefold(), int(updated_task.done), task_id)
+    )
+    if cursor.rowcount == 0:
+        raise ValueError("Task no encontrada")
+    return updated_task
+
+
+def delete_task(task_id: int) -> bool:
+    return _connection().execute(DELETE_TASK, (task_id,)).rowcount > 0
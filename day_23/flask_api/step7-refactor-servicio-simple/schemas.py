@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -16,3 +16,19 @@ class TaskCreate(BaseModel):
 class TaskUpdate(BaseModel):
     title: Optional[str] = Field(default=None, min_length=3, max_length=80)
     done: Optional[bool] = None
+
+
+class TaskPage(BaseModel):
+    items: List[Task]
+    next_cursor: Optional[str] = None
+
+
+class TaskBatchUpdate(TaskUpdate):
+    id: int
+
+
+class TaskBatchResult(BaseModel):
+    index: int
+    status_code: int
+    task: Optional[Task] = None
+    detail: Optional[str] = None
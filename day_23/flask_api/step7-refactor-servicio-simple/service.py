@@ -1,8 +1,21 @@
+import base64
+import binascii
+import os
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
-import repository
-from schemas import Task, TaskCreate, TaskUpdate
+from schemas import Task, TaskBatchResult, TaskBatchUpdate, TaskCreate, TaskPage, TaskUpdate
+
+# TASKS_BACKEND=sqlite cambia el repositorio en memoria por el de SQLite:
+# ambos exponen las mismas funciones.
+if os.getenv("TASKS_BACKEND", "memory") == "sqlite":
+    import repository_sqlite as repository
+else:
+    import repository
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+STREAM_BATCH_SIZE = 500
 
 
 @dataclass
@@ -18,32 +31,127 @@ def model_to_dict(model):
 
 
 def list_tasks(done: Optional[bool] = None) -> List[Task]:
-    tasks = repository.list_tasks()
     if done is None:
-        return tasks
-    return [task for task in tasks if task.done == done]
+        return repository.list_tasks()
+    return repository.list_tasks_by_done(done)
+
+
+def encode_cursor(task_id: int) -> str:
+    return base64.urlsafe_b64encode(str(task_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeError, ValueError):
+        raise AppError(status_code=400, detail="cursor invalido")
+
+
+def list_tasks_page(done: Optional[bool] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> TaskPage:
+    limit = limit or DEFAULT_PAGE_SIZE
+    after_id = decode_cursor(cursor) if cursor else 0
+
+    # Pedimos una tarea de mas para saber si existe una pagina siguiente.
+    tasks = repository.list_tasks_page(after_id=after_id, limit=limit + 1, done=done)
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(tasks[-1].id)
+    return TaskPage(items=tasks, next_cursor=next_cursor)
+
+
+def iter_tasks(done: Optional[bool] = None) -> Iterator[Task]:
+    """Recorre todas las tareas por lotes, sin copiar la coleccion entera."""
+    after_id = 0
+    while True:
+        tasks = repository.list_tasks_page(after_id=after_id, limit=STREAM_BATCH_SIZE, done=done)
+        yield from tasks
+        if len(tasks) < STREAM_BATCH_SIZE:
+            return
+        after_id = tasks[-1].id
 
 
 def create_task(payload: TaskCreate) -> Task:
-    duplicated = any(task.title.lower() == payload.title.lower() for task in repository.list_tasks())
-    if duplicated:
-        raise AppError(status_code=409, detail="Ya existe una tarea con ese titulo")
+    with repository.write_lock():
+        if repository.find_task_by_title(payload.title) is not None:
+            raise AppError(status_code=409, detail="Ya existe una tarea con ese titulo")
 
-    task = Task(id=repository.next_task_id(), title=payload.title, done=False)
-    return repository.save_task(task)
+        task = Task(id=repository.next_task_id(), title=payload.title, done=False)
+        return repository.save_task(task)
 
 
 def update_task(task_id: int, payload: TaskUpdate) -> Task:
-    task = repository.get_task(task_id)
-    if task is None:
-        raise AppError(status_code=404, detail="Tarea no encontrada")
+    with repository.write_lock():
+        task = repository.get_task(task_id)
+        if task is None:
+            raise AppError(status_code=404, detail="Tarea no encontrada")
 
-    data = model_to_dict(payload)
-    updated_task = task.model_copy(update=data) if hasattr(task, "model_copy") else task.copy(update=data)
-    return repository.replace_task(task_id, updated_task)
+        if payload.title is not None:
+            duplicated = repository.find_task_by_title(payload.title)
+            if duplicated is not None and duplicated.id != task_id:
+                raise AppError(status_code=409, detail="Ya existe una tarea con ese titulo")
+
+        data = model_to_dict(payload)
+        updated_task = task.model_copy(update=data) if hasattr(task, "model_copy") else task.copy(update=data)
+        return repository.replace_task(task_id, updated_task)
 
 
 def delete_task(task_id: int) -> None:
     deleted = repository.delete_task(task_id)
     if not deleted:
         raise AppError(status_code=404, detail="Tarea no encontrada")
+
+
+def create_tasks_batch(payloads: List[TaskCreate]) -> List[TaskBatchResult]:
+    with repository.write_lock():
+        results: List[TaskBatchResult] = []
+        accepted: List[Tuple[int, TaskCreate]] = []
+        seen_titles = set()
+
+        # Una sola pasada detecta duplicados dentro del lote y contra el repositorio.
+        for index, payload in enumerate(payloads):
+            title_key = payload.title.casefold()
+            if title_key in seen_titles or repository.find_task_by_title(payload.title) is not None:
+                results.append(
+                    TaskBatchResult(index=index, status_code=409, detail="Ya existe una tarea con ese titulo")
+                )
+                continue
+            seen_titles.add(title_key)
+            accepted.append((index, payload))
+
+        if accepted:
+            task_ids = repository.reserve_task_ids(len(accepted))
+            for task_id, (index, payload) in zip(task_ids, accepted):
+                task = repository.save_task(Task(id=task_id, title=payload.title, done=False))
+                results.append(TaskBatchResult(index=index, status_code=201, task=task))
+
+        results.sort(key=lambda result: result.index)
+        return results
+
+
+def update_tasks_batch(payloads: List[TaskBatchUpdate]) -> List[TaskBatchResult]:
+    results: List[TaskBatchResult] = []
+    seen_ids = set()
+    for index, payload in enumerate(payloads):
+        if payload.id in seen_ids:
+            results.append(TaskBatchResult(index=index, status_code=409, detail="Tarea repetida en el lote"))
+            continue
+        seen_ids.add(payload.id)
+
+        try:
+            task = update_task(payload.id, payload)
+        except AppError as exc:
+            results.append(TaskBatchResult(index=index, status_code=exc.status_code, detail=str(exc.detail)))
+            continue
+        results.append(TaskBatchResult(index=index, status_code=200, task=task))
+    return results
+
+
+def delete_tasks_batch(task_ids: List[int]) -> List[TaskBatchResult]:
+    results: List[TaskBatchResult] = []
+    for index, task_id in enumerate(task_ids):
+        if repository.delete_task(task_id):
+            results.append(TaskBatchResult(index=index, status_code=204))
+        else:
+            results.append(TaskBatchResult(index=index, status_code=404, detail="Tarea no encontrada"))
+    return results
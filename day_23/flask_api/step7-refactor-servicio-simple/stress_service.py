@@ -0,0 +1,125 @@
+"""Prueba de estres: muchos hilos usando el servicio a la vez.
+
+Uso:
+    python stress_service.py
+
+Termina con codigo 1 si algun invariante del repositorio se rompe.
+"""
+import random
+import sys
+from collections import Counter
+from threading import Thread
+from typing import List, Optional
+
+import repository
+import service
+from schemas import TaskCreate, TaskUpdate
+
+THREADS = 16
+OPERATIONS_PER_THREAD = 2_000
+# Pocos titulos posibles para forzar conflictos 409 entre hilos.
+TITLES = [f"Tarea compartida {number}" for number in range(200)]
+# Por debajo de esta proporcion de update/delete con exito, la prueba apenas
+# ejercita la carrera entre hilos y se considera fallida. Es baja porque los
+# update chocan a proposito con titulos ajenos (409) en mas de la mitad de los casos.
+MIN_WRITE_SUCCESS_RATIO = 0.25
+
+
+def pick_live_id(rng: random.Random) -> Optional[int]:
+    # Foto de las tareas vivas (bajo el lock de lectura): los ids crecen sin
+    # parar y uno al azar casi nunca existiria; asi update/delete caen sobre
+    # tareas reales y compiten con los otros hilos.
+    tasks = repository.list_tasks()
+    return rng.choice(tasks).id if tasks else None
+
+
+def worker(seed: int, created_ids: List[int], write_stats: List[Counter], failures: List[str]) -> None:
+    rng = random.Random(seed)
+    stats: Counter = Counter()
+    for _ in range(OPERATIONS_PER_THREAD):
+        operation = rng.random()
+        try:
+            if operation < 0.4:
+                task = service.create_task(TaskCreate(title=rng.choice(TITLES)))
+                created_ids.append(task.id)
+            elif operation < 0.85:
+                task_id = pick_live_id(rng)
+                if task_id is None:
+                    continue
+                kind = "update" if operation < 0.7 else "delete"
+                stats[kind, "attempts"] += 1
+                if kind == "update":
+                    payload = TaskUpdate(title=rng.choice(TITLES).upper(), done=rng.random() < 0.5)
+                    service.update_task(task_id, payload)
+                else:
+                    service.delete_task(task_id)
+                stats[kind, "successes"] += 1
+            else:
+                service.list_tasks_page(done=rng.choice([None, True, False]), limit=20)
+        except service.AppError:
+            pass
+        except Exception as exc:
+            failures.append(repr(exc))
+    write_stats.append(stats)
+
+
+def check_invariants(created_ids: List[int]) -> List[str]:
+    errors = []
+    tasks = repository.list_tasks()
+
+    repeated_ids = [task_id for task_id, total in Counter(created_ids).items() if total > 1]
+    if repeated_ids:
+        errors.append(f"ids entregados mas de una vez: {repeated_ids[:10]}")
+
+    titles = Counter(task.title.casefold() for task in tasks)
+    duplicated_titles = [title for title, total in titles.items() if total > 1]
+    if duplicated_titles:
+        errors.append(f"titulos duplicados: {duplicated_titles[:10]}")
+
+    expected_title_index = {task.title.casefold(): task.id for task in tasks}
+    if repository._task_ids_by_title != expected_title_index:
+        errors.append("el indice de titulos no coincide con las tareas")
+
+    for done in (True, False):
+        expected_ids = sorted(task.id for task in tasks if task.done == done)
+        if list(repository._task_ids_by_done[done]) != expected_ids:
+            errors.append(f"la particion done={done} no coincide con las tareas")
+    return errors
+
+
+def check_write_ratios(write_stats: List[Counter]) -> List[str]:
+    errors = []
+    totals = sum(write_stats, Counter())
+    for kind in ("update", "delete"):
+        attempts = totals[kind, "attempts"]
+        successes = totals[kind, "successes"]
+        print(f"{kind}: {successes}/{attempts} con exito")
+        if attempts == 0 or successes / attempts < MIN_WRITE_SUCCESS_RATIO:
+            errors.append(f"solo {successes} de {attempts} {kind} terminaron con exito")
+    return errors
+
+
+def main() -> int:
+    created_ids: List[int] = []
+    write_stats: List[Counter] = []
+    failures: List[str] = []
+    threads = [
+        Thread(target=worker, args=(seed, created_ids, write_stats, failures)) for seed in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    errors = [f"excepcion inesperada: {failure}" for failure in failures[:10]]
+    errors += check_invariants(created_ids)
+    errors += check_write_ratios(write_stats)
+    total_operations = THREADS * OPERATIONS_PER_THREAD
+    print(f"{total_operations} operaciones en {THREADS} hilos, {len(repository.list_tasks())} tareas finales")
+    for error in errors:
+        print(f"ERROR: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Benchmark de las consultas de practice.sql a distintos tamanos.
+
+Para cada tamano genera datos (generate_data.py, semilla fija), crea una
+base nueva con schema.sql, la carga con bulk_load.py y mide cada consulta
+de practice.sql (mediana de RUNS ejecuciones, leyendo todas las filas).
+Escribe el informe en JSON y CSV para comparar cambios de esquema o de
+indices entre ejecuciones.
+
+Uso:
+    python3 scripts/bench_queries.py sqlite/schema.sql sqlite/practice.sql bench/ [10000 100000 1000000]
+"""
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from bulk_load import bulk_load
+from explain_queries import read_queries
+from generate_data import DEFAULT_SEED, generate
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+RUNS = 5
+
+
+def build_database(db_file, schema_file, students, data_dir):
+    connection = sqlite3.connect(db_file)
+    with open(schema_file, encoding="utf-8") as handle:
+        connection.executescript(handle.read())
+    connection.close()
+    # La salida de la generacion y la carga no forma parte del informe.
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate(students, data_dir)
+        bulk_load(db_file, data_dir)
+    connection = sqlite3.connect(db_file)
+    connection.execute("ANALYZE")
+    connection.close()
+
+
+def time_query(connection, sql):
+    timings = []
+    rows = 0
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        rows = len(connection.execute(sql).fetchall())
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), min(timings), rows
+
+
+def bench(schema_file, practice_file, report_dir, sizes):
+    results = []
+    for students in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            db_file = os.path.join(directory, "bench.db")
+            started = time.perf_counter()
+            build_database(db_file, schema_file, students, os.path.join(directory, "data"))
+            print(f"{students:>9,} estudiantes: base lista en {time.perf_counter() - started:.1f} s")
+
+            connection = sqlite3.connect(db_file)
+            for title, sql, _ in read_queries(practice_file):
+                median_ms, min_ms, rows = time_query(connection, sql)
+                results.append(
+                    {
+                        "students": students,
+                        "query": title,
+                        "median_ms": round(median_ms, 3),
+                        "min_ms": round(min_ms, 3),
+                        "rows": rows,
+                    }
+                )
+                print(f"    {median_ms:>10.2f} ms  {rows:>9,} filas  {title}")
+            connection.close()
+
+    os.makedirs(report_dir, exist_ok=True)
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "seed": DEFAULT_SEED,
+        "runs": RUNS,
+        "sqlite_version": sqlite3.sqlite_version,
+        "python_version": platform.python_version(),
+        "results": results,
+    }
+    json_path = os.path.join(report_dir, "bench-report.json")
+    with open(json_path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, ensure_ascii=False)
+    csv_path = os.path.join(report_dir, "bench-report.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Informe: {json_path} y {csv_path}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("Uso: python3 scripts/bench_queries.py <schema.sql> <practice.sql> <directorio informe> [tamanos...]")
+        sys.exit(1)
+    bench_sizes = [int(size) for size in sys.argv[4:]] or list(DEFAULT_SIZES)
+    bench(sys.argv[1], sys.argv[2], sys.argv[3], bench_sizes)
@@ -0,0 +1,154 @@
+"""Carga masiva de CSV/NDJSON en la base SQLite de day_25.
+
+`sqlite3 < seed.sql` ejecuta cada INSERT en su propia transaccion (un fsync
+por fila). Este cargador:
+
+- lee los ficheros en streaming (memoria constante) y los inserta con
+  executemany dentro de UNA sola transaccion;
+- durante la carga usa PRAGMA synchronous=OFF y journal_mode=MEMORY;
+- borra los indices secundarios antes de cargar y los vuelve a crear al
+  final (construir un indice de una vez es mas rapido que mantenerlo fila
+  a fila);
+- desactiva las claves foraneas durante la carga y las comprueba al final
+  con PRAGMA foreign_key_check: si hay filas huerfanas hace ROLLBACK.
+
+Ficheros esperados en el directorio de datos (todos opcionales), con
+cabecera en CSV o un objeto JSON por linea en NDJSON:
+
+    students.csv|ndjson     name, email, city [, id, created_at]
+    profiles.csv|ndjson     student_id, github_username, linkedin_url [, id]
+    courses.csv|ndjson      name, level, is_active [, id]
+    lessons.csv|ndjson      course_id, title, position [, id]
+    enrollments.csv|ndjson  student_id, course_id [, enrolled_at]
+
+Uso:
+    python3 scripts/bulk_load.py sqlite/day25.db data/
+"""
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+
+TABLES = ("students", "profiles", "courses", "lessons", "enrollments")
+
+
+def read_rows(path):
+    """Devuelve (columnas, iterador de tuplas) sin cargar el fichero entero."""
+    handle = open(path, newline="", encoding="utf-8")
+    if path.endswith(".csv"):
+        reader = csv.reader(handle)
+        columns = next(reader)
+        # En CSV una celda vacia es NULL (p.ej. github_username opcional).
+        rows = (tuple(value if value != "" else None for value in row) for row in reader)
+    else:
+        lines = (line for line in handle if line.strip())
+        first = json.loads(next(lines))
+        columns = list(first)
+        rows = (tuple(record.get(column) for column in columns) for record in map(json.loads, lines))
+        rows = _prepend(tuple(first[column] for column in columns), rows)
+    return columns, _closing(handle, rows)
+
+
+def _prepend(first, rows):
+    yield first
+    yield from rows
+
+
+def _closing(handle, rows):
+    with handle:
+        yield from rows
+
+
+def find_data_file(data_dir, table):
+    for extension in ("csv", "ndjson"):
+        path = os.path.join(data_dir, f"{table}.{extension}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def table_columns(connection, table):
+    return {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+
+
+class RowCounter:
+    def __init__(self, rows):
+        self.rows = rows
+        self.count = 0
+
+    def __iter__(self):
+        for row in self.rows:
+            self.count += 1
+            yield row
+
+
+def bulk_load(db_file, data_dir):
+    connection = sqlite3.connect(db_file, isolation_level=None)
+    connection.execute("PRAGMA foreign_keys = OFF")
+    connection.execute("PRAGMA synchronous = OFF")
+    connection.execute("PRAGMA journal_mode = MEMORY")
+
+    # Indices creados con CREATE INDEX (los de PK/UNIQUE no se pueden borrar).
+    indexes = connection.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+    ).fetchall()
+
+    started_load = time.perf_counter()
+    connection.execute("BEGIN")
+    try:
+        for name, _ in indexes:
+            connection.execute(f"DROP INDEX {name}")
+
+        for table in TABLES:
+            path = find_data_file(data_dir, table)
+            if path is None:
+                continue
+            columns, rows = read_rows(path)
+            unknown = set(columns) - table_columns(connection, table)
+            if unknown:
+                raise ValueError(f"{path}: columnas desconocidas en {table}: {', '.join(sorted(unknown))}")
+
+            placeholders = ", ".join("?" for _ in columns)
+            statement = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            counter = RowCounter(rows)
+            started = time.perf_counter()
+            connection.executemany(statement, counter)
+            elapsed = time.perf_counter() - started
+            rate = counter.count / elapsed if elapsed else 0
+            print(f"{table:<12} {counter.count:>10,} filas {elapsed:>7.2f} s {rate:>12,.0f} filas/s")
+
+        started = time.perf_counter()
+        for _, sql in indexes:
+            connection.execute(sql)
+        if indexes:
+            print(f"{'indices':<12} {len(indexes):>10} creados {time.perf_counter() - started:>5.2f} s")
+
+        orphans = connection.execute("PRAGMA foreign_key_check").fetchall()
+        if orphans:
+            table, rowid, parent, _ = orphans[0]
+            raise ValueError(
+                f"{len(orphans)} filas con clave foranea invalida (p.ej. {table} rowid={rowid} -> {parent})"
+            )
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    finally:
+        connection.execute("PRAGMA journal_mode = DELETE")
+        connection.execute("PRAGMA synchronous = FULL")
+        connection.close()
+
+    print(f"Carga completa en {time.perf_counter() - started_load:.2f} s")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python3 scripts/bulk_load.py <base.db> <directorio de datos>")
+        sys.exit(1)
+    try:
+        bulk_load(sys.argv[1], sys.argv[2])
+    except (ValueError, sqlite3.Error) as error:
+        print(f"Error: {error}")
+        sys.exit(1)
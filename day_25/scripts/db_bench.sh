@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+DB_DIR="$ROOT_DIR/sqlite"
+REPORT_DIR="${1:-$ROOT_DIR/bench}"
+shift || true
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "Error: python3 no esta instalado. Instala python3 y vuelve a intentarlo."
+    exit 1
+fi
+
+# Tamanos opcionales despues del directorio del informe (por defecto 10k 100k 1M).
+python3 "$ROOT_DIR/scripts/bench_queries.py" "$DB_DIR/schema.sql" "$DB_DIR/practice.sql" "$REPORT_DIR" "$@"
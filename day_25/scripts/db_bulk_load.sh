@@ -0,0 +1,26 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+DB_DIR="$ROOT_DIR/sqlite"
+DB_FILE="${1:-$DB_DIR/day25.db}"
+DATA_DIR="${2:-$ROOT_DIR/data}"
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "Error: python3 no esta instalado. Instala python3 y vuelve a intentarlo."
+    exit 1
+fi
+
+if [ ! -d "$DATA_DIR" ]; then
+    echo "No existe el directorio de datos: $DATA_DIR"
+    echo "Debe contener students/profiles/courses/lessons/enrollments en .csv o .ndjson"
+    exit 1
+fi
+
+if [ ! -f "$DB_FILE" ]; then
+    "$ROOT_DIR/scripts/db_init.sh" "$DB_FILE"
+fi
+
+python3 "$ROOT_DIR/scripts/bulk_load.py" "$DB_FILE" "$DATA_DIR"
+
+echo "Datos cargados en: $DB_FILE"
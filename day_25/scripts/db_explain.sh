@@ -0,0 +1,25 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+DB_DIR="$ROOT_DIR/sqlite"
+DB_FILE="${1:-$DB_DIR/day25.db}"
+SQL_FILE="${2:-$DB_DIR/practice.sql}"
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "Error: python3 no esta instalado. Instala python3 y vuelve a intentarlo."
+    exit 1
+fi
+
+if [ ! -f "$DB_FILE" ]; then
+    echo "No existe la base: $DB_FILE"
+    echo "Ejecuta primero scripts/db_init.sh o make db-schema"
+    exit 1
+fi
+
+if [ ! -f "$SQL_FILE" ]; then
+    echo "No existe el archivo SQL: $SQL_FILE"
+    exit 1
+fi
+
+python3 "$ROOT_DIR/scripts/explain_queries.py" "$DB_FILE" "$SQL_FILE"
@@ -0,0 +1,16 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+STUDENTS="${1:-10000}"
+DATA_DIR="${2:-$ROOT_DIR/data}"
+SEED="${3:-25}"
+
+if ! command -v python3 >/dev/null 2>&1; then
+    echo "Error: python3 no esta instalado. Instala python3 y vuelve a intentarlo."
+    exit 1
+fi
+
+python3 "$ROOT_DIR/scripts/generate_data.py" "$STUDENTS" "$DATA_DIR" "$SEED"
+
+echo "Para cargarlos: make db-bulk-load DATA_DIR=$DATA_DIR"
@@ -0,0 +1,78 @@
+"""Revisa el plan de cada consulta de un fichero .sql con EXPLAIN QUERY PLAN.
+
+Falla (codigo 1) si alguna consulta recorre una tabla entera (`SCAN tabla`
+sin indice). Una consulta que lista todas las filas a proposito puede
+declararlo en sus comentarios:
+
+    -- scan-permitido: students
+
+(el nombre es la tabla o el alias tal como aparece en el plan).
+
+Uso:
+    python3 scripts/explain_queries.py sqlite/day25.db sqlite/practice.sql
+"""
+import re
+import sqlite3
+import sys
+
+ALLOW_PATTERN = re.compile(r"--\s*scan-permitido:\s*([\w ,]+?)(?:\s*\(|$)", re.MULTILINE)
+SCAN_PATTERN = re.compile(r"^SCAN (\w+)(.*)$")
+
+
+def read_queries(sql_file):
+    """Devuelve [(titulo, sql, tablas con scan permitido)] en orden."""
+    queries = []
+    pending = ""
+    with open(sql_file, encoding="utf-8") as handle:
+        for line in handle:
+            pending += line
+            if not sqlite3.complete_statement(pending):
+                continue
+            comments = [row.strip() for row in pending.splitlines() if row.strip().startswith("--")]
+            title = comments[0].lstrip("- ") if comments else pending.strip().splitlines()[0]
+            allowed = set()
+            for match in ALLOW_PATTERN.finditer(pending):
+                allowed.update(name.strip() for name in match.group(1).split(",") if name.strip())
+            queries.append((title, pending.strip(), allowed))
+            pending = ""
+    return queries
+
+
+def full_scans(plan, allowed):
+    scans = []
+    for detail in plan:
+        match = SCAN_PATTERN.match(detail)
+        if match and "INDEX" not in match.group(2) and match.group(1) not in allowed:
+            scans.append(detail)
+    return scans
+
+
+def explain_queries(db_file, sql_file):
+    connection = sqlite3.connect(db_file)
+    failures = 0
+    for title, sql, allowed in read_queries(sql_file):
+        try:
+            plan = [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}")]
+        except sqlite3.Error as error:
+            print(f"ERROR {title}: {error}")
+            failures += 1
+            continue
+        scans = full_scans(plan, allowed)
+        failures += bool(scans)
+        print(f"{'FALLO' if scans else 'OK   '} {title}")
+        for detail in plan:
+            marker = "!!" if detail in scans else "  "
+            print(f"      {marker} {detail}")
+    connection.close()
+    return failures
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python3 scripts/explain_queries.py <base.db> <consultas.sql>")
+        sys.exit(1)
+    total_failures = explain_queries(sys.argv[1], sys.argv[2])
+    if total_failures:
+        print(f"{total_failures} consultas con recorrido completo de tabla")
+        sys.exit(1)
+    print("Ninguna consulta recorre una tabla entera")
@@ -0,0 +1,134 @@
+"""Generador determinista de datos sinteticos para la base de day_25.
+
+Con la misma semilla produce siempre los mismos ficheros, asi dos
+benchmarks se pueden comparar. La distribucion imita datos reales:
+
+- ciudades con pesos muy distintos (Madrid y Barcelona concentran mas
+  estudiantes que el resto);
+- popularidad de cursos tipo Zipf: pocos cursos acumulan la mayoria de
+  inscripciones;
+- cada estudiante se inscribe en 1 a 6 cursos (la mayoria en 1 o 2) y
+  ~80% tiene perfil.
+
+Escribe CSV listos para scripts/bulk_load.py:
+students, profiles, courses, lessons y enrollments.
+
+Uso:
+    python3 scripts/generate_data.py 10000 data/ [semilla]
+"""
+import csv
+import os
+import random
+import sys
+from datetime import date, timedelta
+from itertools import accumulate
+
+DEFAULT_SEED = 25
+CITIES = {
+    "Madrid": 30,
+    "Barcelona": 25,
+    "Valencia": 10,
+    "Sevilla": 8,
+    "Malaga": 6,
+    "Bilbao": 5,
+    "Zaragoza": 4,
+    "Murcia": 3,
+    "Palma": 3,
+    "Valladolid": 2,
+    "Vigo": 2,
+    "Granada": 2,
+}
+LEVELS = ("beginner", "intermediate", "advanced")
+TOPICS = ("SQL", "Python", "Flask", "FastAPI", "React", "JavaScript", "Docker", "Git", "Testing", "Modelado")
+ENROLLMENTS_PER_STUDENT = {1: 40, 2: 30, 3: 15, 4: 8, 5: 5, 6: 2}
+FIRST_ENROLLMENT = date(2025, 9, 1)
+ENROLLMENT_DAYS = 365
+
+
+def total_courses(students):
+    return max(20, students // 500)
+
+
+def write_csv(path, columns, rows):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def generate(students, data_dir, seed=DEFAULT_SEED):
+    rng = random.Random(seed)
+    os.makedirs(data_dir, exist_ok=True)
+    courses = total_courses(students)
+
+    cities = list(CITIES)
+    city_weights = list(accumulate(CITIES.values()))
+    write_csv(
+        os.path.join(data_dir, "students.csv"),
+        ("id", "name", "email", "city"),
+        (
+            (student_id, f"Estudiante {student_id}", f"estudiante{student_id}@example.com",
+             rng.choices(cities, cum_weights=city_weights)[0])
+            for student_id in range(1, students + 1)
+        ),
+    )
+
+    write_csv(
+        os.path.join(data_dir, "profiles.csv"),
+        ("student_id", "github_username", "linkedin_url"),
+        (
+            (student_id, f"dev{student_id}" if rng.random() < 0.7 else "",
+             f"https://www.linkedin.com/in/dev{student_id}" if rng.random() < 0.5 else "")
+            for student_id in range(1, students + 1)
+            if rng.random() < 0.8
+        ),
+    )
+
+    write_csv(
+        os.path.join(data_dir, "courses.csv"),
+        ("id", "name", "level", "is_active"),
+        (
+            (course_id, f"{TOPICS[course_id % len(TOPICS)]} {course_id}", rng.choice(LEVELS),
+             0 if rng.random() < 0.1 else 1)
+            for course_id in range(1, courses + 1)
+        ),
+    )
+
+    write_csv(
+        os.path.join(data_dir, "lessons.csv"),
+        ("course_id", "title", "position"),
+        (
+            (course_id, f"Leccion {position}", position)
+            for course_id in range(1, courses + 1)
+            for position in range(1, rng.randint(5, 20) + 1)
+        ),
+    )
+
+    # Zipf: el curso k tiene peso 1/k.
+    course_weights = list(accumulate(1 / rank for rank in range(1, courses + 1)))
+    counts = list(ENROLLMENTS_PER_STUDENT)
+    count_weights = list(accumulate(ENROLLMENTS_PER_STUDENT.values()))
+
+    def enrollments():
+        for student_id in range(1, students + 1):
+            wanted = rng.choices(counts, cum_weights=count_weights)[0]
+            chosen = set()
+            while len(chosen) < wanted:
+                chosen.add(rng.choices(range(1, courses + 1), cum_weights=course_weights)[0])
+            for course_id in sorted(chosen):
+                enrolled_at = FIRST_ENROLLMENT + timedelta(days=rng.randrange(ENROLLMENT_DAYS))
+                yield student_id, course_id, enrolled_at.isoformat()
+
+    write_csv(
+        os.path.join(data_dir, "enrollments.csv"),
+        ("student_id", "course_id", "enrolled_at"),
+        enrollments(),
+    )
+    print(f"Generados {students:,} estudiantes y {courses:,} cursos en {data_dir} (semilla {seed})")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print("Uso: python3 scripts/generate_data.py <estudiantes> <directorio> [semilla]")
+        sys.exit(1)
+    generate(int(sys.argv[1]), sys.argv[2], int(sys.argv[3]) if len(sys.argv) == 4 else DEFAULT_SEED)
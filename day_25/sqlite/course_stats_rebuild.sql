@@ -0,0 +1,16 @@
+-- Reconstruye course_stats desde cero (p.ej. despues de cargar datos con
+-- los triggers desactivados o para corregir un descuadre).
+BEGIN;
+
+DELETE FROM course_stats;
+
+INSERT INTO course_stats (course_id, total_students, last_enrolled_at)
+SELECT c.id, COUNT(e.student_id), MAX(e.enrolled_at)
+FROM courses c
+LEFT JOIN enrollments e ON e.course_id = c.id
+GROUP BY c.id;
+
+COMMIT;
+
+SELECT COUNT(*) AS cursos_reconstruidos
+FROM course_stats;
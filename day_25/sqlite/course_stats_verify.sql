@@ -0,0 +1,20 @@
+-- Compara course_stats con el conteo real de enrollments.
+-- cursos_descuadrados = 0 significa que la tabla resumen es exacta.
+WITH live AS (
+    SELECT
+        c.id AS course_id,
+        c.name,
+        COUNT(e.student_id) AS total_students,
+        MAX(e.enrolled_at) AS last_enrolled_at
+    FROM courses c
+    LEFT JOIN enrollments e ON e.course_id = c.id
+    GROUP BY c.id
+)
+SELECT
+    COUNT(*) AS cursos_descuadrados,
+    group_concat(live.name, ', ') AS cursos
+FROM live
+LEFT JOIN course_stats cs ON cs.course_id = live.course_id
+WHERE cs.course_id IS NULL
+   OR cs.total_students <> live.total_students
+   OR cs.last_enrolled_at IS NOT live.last_enrolled_at;
@@ -1,4 +1,5 @@
 -- Listado simple de estudiantes.
+-- scan-permitido: students (lista todas las filas)
 SELECT id, name, city
 FROM students
 ORDER BY id;
@@ -10,16 +11,30 @@ JOIN students s ON s.id = e.student_id
 JOIN courses c ON c.id = e.course_id
 ORDER BY student, course;
 
--- GROUP BY + HAVING: cursos con mas de un estudiante.
-SELECT c.name, COUNT(*) AS total_students
-FROM enrollments e
-JOIN courses c ON c.id = e.course_id
-GROUP BY c.name
-HAVING COUNT(*) > 1
-ORDER BY total_students DESC, c.name;
+-- Cursos con mas de un estudiante, leyendo la tabla resumen course_stats.
+-- Equivale a contar todas las inscripciones con
+-- GROUP BY c.name HAVING COUNT(*) > 1, pero sin recorrer enrollments.
+SELECT c.name, cs.total_students
+FROM course_stats cs
+JOIN courses c ON c.id = cs.course_id
+WHERE cs.total_students > 1
+ORDER BY cs.total_students DESC, c.name;
 
 -- Relacion 1-1: estudiante y su perfil.
+-- scan-permitido: s (lista todos los estudiantes)
 SELECT s.name, p.github_username
 FROM students s
 JOIN profiles p ON p.student_id = s.id
 ORDER BY s.id;
+
+-- GROUP BY: estudiantes por ciudad.
+SELECT city, COUNT(*) AS total_students
+FROM students
+GROUP BY city
+ORDER BY total_students DESC, city;
+
+-- WHERE: estudiantes de una ciudad.
+SELECT id, name
+FROM students
+WHERE city = 'Madrid'
+ORDER BY name;
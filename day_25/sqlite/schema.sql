@@ -40,3 +40,71 @@ CREATE TABLE enrollments (
     FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE,
     FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
 );
+
+-- Indices secundarios.
+-- La PK (student_id, course_id) solo sirve para buscar por estudiante; los
+-- JOIN y GROUP BY por curso necesitan el orden inverso.
+CREATE INDEX idx_enrollments_course_student ON enrollments (course_id, student_id);
+
+-- Filtros y agrupaciones por ciudad.
+CREATE INDEX idx_students_city ON students (city);
+
+-- lessons(course_id, position) ya tiene indice: lo crea UNIQUE (course_id, position).
+
+-- Resumen por curso mantenido por triggers: el numero de estudiantes se lee
+-- de una fila en vez de contar todas las inscripciones con GROUP BY.
+-- Reconstruir: sqlite/course_stats_rebuild.sql. Verificar: sqlite/course_stats_verify.sql.
+CREATE TABLE course_stats (
+    course_id INTEGER PRIMARY KEY,
+    total_students INTEGER NOT NULL DEFAULT 0 CHECK (total_students >= 0),
+    last_enrolled_at TEXT,
+    FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_course_stats_total_students ON course_stats (total_students);
+
+CREATE TRIGGER trg_courses_insert_stats
+AFTER INSERT ON courses
+BEGIN
+    INSERT INTO course_stats (course_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER trg_enrollments_insert_stats
+AFTER INSERT ON enrollments
+BEGIN
+    UPDATE course_stats
+    SET total_students = total_students + 1,
+        last_enrolled_at = CASE
+            WHEN last_enrolled_at IS NULL OR NEW.enrolled_at > last_enrolled_at THEN NEW.enrolled_at
+            ELSE last_enrolled_at
+        END
+    WHERE course_id = NEW.course_id;
+END;
+
+-- Tambien se dispara con los borrados en cascada desde students y courses.
+CREATE TRIGGER trg_enrollments_delete_stats
+AFTER DELETE ON enrollments
+BEGIN
+    UPDATE course_stats
+    SET total_students = total_students - 1,
+        last_enrolled_at = CASE
+            WHEN OLD.enrolled_at < last_enrolled_at THEN last_enrolled_at
+            ELSE (SELECT MAX(enrolled_at) FROM enrollments WHERE course_id = OLD.course_id)
+        END
+    WHERE course_id = OLD.course_id;
+END;
+
+-- Cambiar de curso o de fecha una inscripcion = borrarla + insertarla.
+CREATE TRIGGER trg_enrollments_update_stats
+AFTER UPDATE OF course_id, enrolled_at ON enrollments
+BEGIN
+    UPDATE course_stats
+    SET total_students = total_students - 1,
+        last_enrolled_at = (SELECT MAX(enrolled_at) FROM enrollments WHERE course_id = OLD.course_id)
+    WHERE course_id = OLD.course_id;
+
+    UPDATE course_stats
+    SET total_students = total_students + 1,
+        last_enrolled_at = (SELECT MAX(enrolled_at) FROM enrollments WHERE course_id = NEW.course_id)
+    WHERE course_id = NEW.course_id;
+END;
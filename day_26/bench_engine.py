@@ -0,0 +1,89 @@
+"""Benchmark de concurrencia: perfil de engine `default` vs `tuned`.
+
+Simula varios workers de gunicorn (procesos) contra el mismo fichero SQLite.
+Cada "peticion" lee personajes con su planeta y, una de cada WRITE_EVERY,
+crea un usuario con perfil. Cuenta peticiones/s y errores
+"database is locked".
+
+Uso:
+
+    python -m day_26.bench_engine
+    python -m day_26.bench_engine 16   # numero de workers
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+WORKERS = 8
+DURATION_SECONDS = 5.0
+WRITE_EVERY = 5
+
+
+def _setup_database():
+    from day_26.example_app import db, get_app
+    from day_26.example_queries import insert_seed_data
+
+    with get_app().app_context():
+        db.create_all()
+        insert_seed_data()
+
+
+def _worker(worker_id):
+    from sqlalchemy.exc import OperationalError
+
+    from day_26.example_app import db, get_app
+    from day_26.example_queries import insert_specific_user, join_characters_with_homeworld
+
+    requests = 0
+    locked = 0
+    latencies = []
+    deadline = time.perf_counter() + DURATION_SECONDS
+    with get_app().app_context():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                join_characters_with_homeworld()
+                if requests % WRITE_EVERY == 0:
+                    insert_specific_user(
+                        email=f"worker{worker_id}-{requests}@example.com",
+                        username=f"worker{worker_id}_{requests}",
+                        bio="bench",
+                    )
+            except OperationalError as error:
+                if "locked" not in str(error):
+                    raise
+                locked += 1
+            finally:
+                db.session.remove()
+            latencies.append(time.perf_counter() - started)
+            requests += 1
+    return requests, locked, latencies
+
+
+def bench_profile(profile, workers):
+    with tempfile.TemporaryDirectory() as directory:
+        # Los procesos hijos ('spawn') heredan estas variables y construyen su app con ellas.
+        os.environ["DB_PROFILE"] = profile
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(1) as pool:
+            pool.apply(_setup_database)
+        with context.Pool(workers) as pool:
+            results = pool.map(_worker, range(workers))
+
+    requests = sum(result[0] for result in results)
+    locked = sum(result[1] for result in results)
+    latencies = sorted(latency for result in results for latency in result[2])
+    p99_ms = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0
+    print(
+        f"{profile:<8} {workers} workers: {requests / DURATION_SECONDS:>9,.0f} peticiones/s  "
+        f"p99 {p99_ms:>7.1f} ms  'database is locked': {locked}"
+    )
+
+
+if __name__ == "__main__":
+    total_workers = int(sys.argv[1]) if len(sys.argv) > 1 else WORKERS
+    for profile_name in ("default", "tuned"):
+        bench_profile(profile_name, total_workers)
@@ -0,0 +1,109 @@
+"""Carga masiva de datos con Core `insert()` + executemany.
+
+`insert_seed_data()` crea objetos ORM uno a uno y los guarda con el unit of
+work: perfecto para dos planetas, lento para cientos de miles de filas.
+Aqui las filas son dicts planos, se insertan por lotes con
+`db.session.execute(insert(Model), rows)` y las claves foraneas se resuelven
+por clave natural (nombre del planeta, titulo de la pelicula, nombre del
+personaje).
+
+Uso con datos sinteticos:
+
+    python -m day_26.bulk_seed 100000
+"""
+import sys
+import time
+from itertools import islice
+
+from sqlalchemy import insert, select
+
+from day_26.example_app import db, get_app
+from day_26.example_models import Character, Film, Planet, character_films
+
+BATCH_SIZE = 10_000
+
+
+def batched(rows, size):
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class SeedReport:
+    def __init__(self):
+        self.tables = {}
+
+    def add(self, table, rows, seconds):
+        total_rows, total_seconds = self.tables.get(table, (0, 0.0))
+        self.tables[table] = (total_rows + rows, total_seconds + seconds)
+
+    def print(self):
+        for table, (rows, seconds) in self.tables.items():
+            rate = rows / seconds if seconds else 0
+            print(f"{table:<18} {rows:>10,} filas {seconds:>8.2f} s {rate:>12,.0f} filas/s")
+
+
+def _insert_batches(report, table_name, statement, rows, batch_size):
+    for batch in batched(rows, batch_size):
+        started = time.perf_counter()
+        db.session.execute(statement, batch)
+        report.add(table_name, len(batch), time.perf_counter() - started)
+
+
+def bulk_seed(planets=(), films=(), characters=(), character_film_links=(), batch_size=BATCH_SIZE):
+    """Inserta filas en lote y hace un unico commit al final.
+
+    - planets: dicts con `name`, `climate`
+    - films: dicts con `title`, `release_year`
+    - characters: dicts con `name`, `species`, `planet` (nombre del planeta)
+    - character_film_links: dicts con `character` (nombre) y `film` (titulo)
+    """
+    report = SeedReport()
+
+    _insert_batches(report, "planets", insert(Planet), planets, batch_size)
+    _insert_batches(report, "films", insert(Film), films, batch_size)
+
+    planet_ids = dict(db.session.execute(select(Planet.name, Planet.id)).all())
+    character_rows = (
+        {"name": row["name"], "species": row.get("species"), "planet_id": planet_ids[row["planet"]]}
+        for row in characters
+    )
+    _insert_batches(report, "characters", insert(Character), character_rows, batch_size)
+
+    character_ids = dict(db.session.execute(select(Character.name, Character.id)).all())
+    film_ids = dict(db.session.execute(select(Film.title, Film.id)).all())
+    link_rows = (
+        {"character_id": character_ids[row["character"]], "film_id": film_ids[row["film"]]}
+        for row in character_film_links
+    )
+    _insert_batches(report, "character_films", insert(character_films), link_rows, batch_size)
+
+    started = time.perf_counter()
+    db.session.commit()
+    report.add("commit", 0, time.perf_counter() - started)
+    return report
+
+
+def synthetic_data(total_characters, total_planets=100, total_films=50, films_per_character=3):
+    planets = [{"name": f"Planeta {number}", "climate": "templado"} for number in range(total_planets)]
+    films = [{"title": f"Pelicula {number}", "release_year": 1977 + number} for number in range(total_films)]
+    characters = (
+        {"name": f"Personaje {number}", "species": "Human", "planet": f"Planeta {number % total_planets}"}
+        for number in range(total_characters)
+    )
+    links = (
+        {"character": f"Personaje {number}", "film": f"Pelicula {(number + offset) % total_films}"}
+        for number in range(total_characters)
+        for offset in range(films_per_character)
+    )
+    return planets, films, characters, links
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with get_app().app_context():
+        db.create_all()
+        bulk_seed(*synthetic_data(total)).print()
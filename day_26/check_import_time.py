@@ -0,0 +1,92 @@
+"""Control de regresion del coste de importar day_26.
+
+Importa cada modulo en un interprete nuevo con `python -X importtime` y
+compara el tiempo acumulado con su presupuesto. Antes se importan Flask,
+Flask-SQLAlchemy y SQLAlchemy (PRELOADED_MODULES): son ~450 ms que ningun
+cambio en day_26 puede quitar y que taparian una regresion. Asi se mide
+solo lo que cuesta day_26: unos 3/20/50 ms con la app perezosa frente a
+130-260 ms si se vuelve a construir la app (y cargar Alembic) al importar.
+Ademas comprueba que importar los modelos o las consultas NO construye la
+app ni carga Flask-Migrate/Alembic (ver get_app() en example_app.py).
+
+Uso (desde la raiz del repo):
+
+    python -m day_26.check_import_time
+
+Sale con codigo 1 si algo se pasa del presupuesto. En maquinas lentas se
+puede escalar con IMPORT_BUDGET_SCALE=2.
+"""
+import os
+import subprocess
+import sys
+
+# Presupuesto en milisegundos (mejor de RUNS ejecuciones), sin contar
+# PRELOADED_MODULES: linea base perezosa x2 aprox., muy por debajo de la
+# importacion con la app construida.
+IMPORT_BUDGET_MS = {
+    "day_26.example_app": 20,
+    "day_26.example_models": 50,
+    "day_26.example_queries": 100,
+}
+PRELOADED_MODULES = ("flask", "flask_sqlalchemy", "sqlalchemy.orm")
+FORBIDDEN_MODULES = ("flask_migrate", "alembic")
+RUNS = 3
+
+LAZY_CHECK = """
+import sys
+import day_26.example_queries
+from day_26 import example_app
+loaded = [name for name in {forbidden!r} if name in sys.modules]
+built = "app" in vars(example_app) or vars(example_app).get("_app") is not None
+print("app_construida" if built else "", *loaded)
+"""
+
+
+def import_time_ms(module):
+    """Mejor tiempo acumulado (ms) de importar `module` en un proceso nuevo."""
+    best = None
+    for _ in range(RUNS):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {', '.join(PRELOADED_MODULES)}; import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in completed.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                cumulative_ms = int(parts[1]) / 1000
+                best = cumulative_ms if best is None else min(best, cumulative_ms)
+    return best
+
+
+def check_lazy_imports():
+    completed = subprocess.run(
+        [sys.executable, "-c", LAZY_CHECK.format(forbidden=FORBIDDEN_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    problems = completed.stdout.split()
+    if problems:
+        print(f"FALLO importar day_26.example_queries carga: {' '.join(problems)}")
+        return False
+    print("OK    importar day_26.example_queries no construye la app ni carga Alembic")
+    return True
+
+
+def main():
+    scale = float(os.getenv("IMPORT_BUDGET_SCALE", "1"))
+    ok = check_lazy_imports()
+    for module, budget_ms in IMPORT_BUDGET_MS.items():
+        elapsed_ms = import_time_ms(module)
+        within_budget = elapsed_ms <= budget_ms * scale
+        ok = ok and within_budget
+        status = "OK   " if within_budget else "FALLO"
+        print(f"{status} {module:<24} {elapsed_ms:>7.1f} ms (presupuesto {budget_ms * scale:.0f} ms)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
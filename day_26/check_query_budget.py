@@ -0,0 +1,116 @@
+"""Control de regresion N+1: cada perfil de carga tiene un maximo de queries.
+
+Crea una base SQLite temporal con varias filas por tabla, lista y serializa
+usuarios, personajes y planetas con su perfil de LOADING_PROFILES y cuenta
+las sentencias con count_queries(max_queries=...). El numero no depende de
+cuantas filas haya: si alguien quita un joinedload/selectinload o el
+serializador toca una relacion nueva, el recuento crece y el control falla.
+
+Tambien comprueba que, sin perfil, la misma lectura SI se pasa del limite:
+asi se sabe que los datos de prueba son suficientes para destapar un N+1.
+
+Uso (desde la raiz del repo):
+
+    python -m day_26.check_query_budget
+
+Sale con codigo 1 si algun perfil se pasa de su presupuesto.
+"""
+import os
+import sys
+import tempfile
+
+from day_26.example_app import db, get_app
+from day_26.example_models import Character, Favorite, Film, Planet, User, UserProfile
+from day_26.example_queries import character_to_dict, list_characters, list_planets, list_users, user_to_dict
+from day_26.query_counter import count_queries
+
+ROWS = 20
+
+
+def serialize_users(profile):
+    return [user_to_dict(user) for user in list_users(profile)]
+
+
+def serialize_characters(profile):
+    return [character_to_dict(character) for character in list_characters(profile)]
+
+
+def serialize_planets(profile):
+    return [[character.name for character in planet.characters] for planet in list_planets(profile)]
+
+
+# (perfil, funcion que lee y serializa, maximo de queries)
+QUERY_BUDGETS = [
+    # users + JOIN profile; favorites con character y homeworld en un SELECT ... IN
+    ("user_full", serialize_users, 2),
+    # characters + JOIN homeworld; films en un SELECT ... IN
+    ("character_card", serialize_characters, 2),
+    # planets; characters en un SELECT ... IN
+    ("planet_characters", serialize_planets, 2),
+]
+
+
+def insert_budget_data():
+    planets = [Planet(name=f"Planeta {number}") for number in range(ROWS // 4)]
+    films = [Film(title=f"Pelicula {number}", release_year=1977 + number) for number in range(ROWS // 4)]
+    characters = [
+        Character(
+            name=f"Personaje {number}",
+            homeworld=planets[number % len(planets)],
+            films=[films[number % len(films)], films[(number + 1) % len(films)]],
+        )
+        for number in range(ROWS)
+    ]
+    users = []
+    for number in range(ROWS):
+        user = User(email=f"usuario{number}@example.com", username=f"usuario_{number}")
+        user.profile = UserProfile(bio=f"Bio {number}")
+        user.favorites = [
+            Favorite(character=characters[number]),
+            Favorite(character=characters[(number + 1) % ROWS]),
+        ]
+        users.append(user)
+
+    db.session.add_all([*planets, *films, *characters, *users])
+    db.session.commit()
+
+
+def count_for(function, profile, max_queries=None):
+    db.session.expire_all()
+    with count_queries(max_queries=max_queries) as counter:
+        function(profile)
+    return counter.count
+
+
+def main():
+    ok = True
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'budget.db')}"
+        with get_app().app_context():
+            db.create_all()
+            insert_budget_data()
+
+            for profile, function, budget in QUERY_BUDGETS:
+                without_profile = count_for(function, None)
+                try:
+                    queries = count_for(function, profile, max_queries=budget)
+                except AssertionError as exc:
+                    ok = False
+                    print(f"FALLO {profile:<18} {exc}")
+                    continue
+
+                if without_profile <= budget:
+                    ok = False
+                    print(
+                        f"FALLO {profile:<18} sin perfil solo hay {without_profile} queries:"
+                        " los datos no destapan un N+1"
+                    )
+                    continue
+                print(f"OK    {profile:<18} {queries} queries (presupuesto {budget}, sin perfil {without_profile})")
+            db.session.remove()
+            db.engine.dispose()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,111 @@
 import os
+import threading
 
 from flask import Flask
-from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 
+# Importar este modulo solo crea `db`. La app (y Flask-Migrate, que importa
+# Alembic) se construye la primera vez que alguien la pide con get_app() o
+# con `from day_26.example_app import app`: los modelos, scripts y workers
+# que no la necesitan arrancan mucho mas rapido.
 db = SQLAlchemy()
-migrate = Migrate()
+
+_app = None
+_app_lock = threading.Lock()
+
+# Perfil de rendimiento del engine: DB_PROFILE=tuned (por defecto) o
+# DB_PROFILE=default para usar las opciones por defecto de SQLAlchemy.
+# Cada valor se puede cambiar con su variable de entorno.
+SQLITE_PRAGMAS = {
+    # WAL: los lectores no bloquean al escritor ("database is locked").
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    # Con WAL, NORMAL solo hace fsync en los checkpoints y sigue siendo seguro.
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)),
+    # Negativo = KiB: 64 MB de cache de paginas por conexion.
+    "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-64000"),
+    # Esperar al lock en vez de fallar enseguida cuando otro worker escribe.
+    "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+}
+
+
+def engine_options(database_uri):
+    if os.getenv("DB_PROFILE", "tuned") == "default":
+        return {}
+
+    options = {
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "1") == "1",
+        # Cache de SQL compilado de SQLAlchemy (sentencias distintas).
+        "query_cache_size": int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
+    }
+    url = make_url(database_uri)
+    is_sqlite = url.get_backend_name() == "sqlite"
+    if not (is_sqlite and url.database in (None, "", ":memory:")):
+        # SQLite en memoria usa StaticPool (una sola conexion): sin tamanos.
+        options["pool_size"] = int(os.getenv("DB_POOL_SIZE", "5"))
+        options["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        options["pool_timeout"] = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        options["pool_recycle"] = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    if is_sqlite:
+        # Sentencias preparadas que cachea cada conexion sqlite3.
+        options["connect_args"] = {"cached_statements": int(os.getenv("SQLITE_CACHED_STATEMENTS", "256"))}
+    return options
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
 
 
 def create_app():
+    from flask_migrate import Migrate
+
     app = Flask(__name__)
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", "sqlite:///day26.db")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config["SQLALCHEMY_DATABASE_URI"])
 
     db.init_app(app)
-    migrate.init_app(app, db)
+    Migrate(app, db)
+
+    with app.app_context():
+        if os.getenv("DB_PROFILE", "tuned") != "default" and db.engine.dialect.name == "sqlite":
+            event.listen(db.engine, "connect", set_sqlite_pragmas)
 
     # Import models after db init so Flask-Migrate can detect metadata.
     from day_26 import example_models  # noqa: F401
 
+    @app.cli.command("rebuild-favorite-counts")
+    def rebuild_favorite_counts_command():
+        """Recalcula Character.favorite_count desde la tabla favorites."""
+        from day_26.example_queries import rebuild_favorite_counts
+
+        print(f"Contadores corregidos: {rebuild_favorite_counts()}")
+
     @app.get("/health")
     def health():
-        return {"status": "ok", "module": "day_26"}
+        from day_26.query_cache import query_cache
+
+        return {"status": "ok", "module": "day_26", "query_cache": query_cache.metrics()}
 
     return app
 
 
-app = create_app()
+def get_app():
+    global _app
+    if _app is None:
+        with _app_lock:
+            if _app is None:
+                _app = create_app()
+    return _app
+
+
+def __getattr__(name):
+    # `flask --app day_26/example_app.py` busca el atributo `app`.
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,16 @@
 from datetime import datetime
 
+from sqlalchemy import event, update
+
 from day_26.example_app import db
 
 character_films = db.Table(
     "character_films",
     db.Column("character_id", db.Integer, db.ForeignKey("characters.id"), primary_key=True),
     db.Column("film_id", db.Integer, db.ForeignKey("films.id"), primary_key=True),
+    # La PK (character_id, film_id) sirve para ir de personaje a peliculas;
+    # este indice cubre el sentido contrario (pelicula -> personajes).
+    db.Index("ix_character_films_film_id", "film_id"),
 )
 
 
@@ -57,11 +62,19 @@ class Planet(db.Model):
 
 class Character(db.Model):
     __tablename__ = "characters"
-
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), unique=True, nullable=False)
     species = db.Column(db.String(120), nullable=True)
-    planet_id = db.Column(db.Integer, db.ForeignKey("planets.id"), nullable=False)
+    planet_id = db.Column(db.Integer, db.ForeignKey("planets.id"), nullable=False, index=True)
+    # Copia desnormalizada de COUNT(favorites): la mantienen los eventos de
+    # Favorite al final de este archivo. Indexada para el ranking.
+    favorite_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    # Mismo orden que top_characters_by_favorites (favorite_count DESC,
+    # name ASC): SQLite lee el ranking del indice ya ordenado. Se declara con
+    # las columnas y no con texto ("favorite_count DESC") para que Alembic
+    # autogenerate lo compare bien con el de la base.
+    __table_args__ = (db.Index("ix_characters_favorite_count_name", favorite_count.desc(), name),)
 
     # N-1 side from Character to Planet
     homeworld = db.relationship("Planet", back_populates="characters")
@@ -99,9 +112,32 @@ class Favorite(db.Model):
     __tablename__ = "favorites"
 
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), primary_key=True)
-    character_id = db.Column(db.Integer, db.ForeignKey("characters.id"), primary_key=True)
+    character_id = db.Column(db.Integer, db.ForeignKey("characters.id"), primary_key=True, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     note = db.Column(db.String(120), nullable=True)
 
     user = db.relationship("User", back_populates="favorites")
     character = db.relationship("Character", back_populates="favorites")
+
+
+# Contador favorite_count: +1 / -1 en la misma transaccion que el INSERT o
+# DELETE del Favorite (tambien en los borrados en cascada del ORM). Los
+# INSERT/DELETE hechos con Core (insert(Favorite), SQL a mano) no pasan por
+# aqui: despues hay que llamar a rebuild_favorite_counts().
+def _increment_favorite_count(connection, character_id, delta):
+    characters = Character.__table__
+    connection.execute(
+        update(characters)
+        .where(characters.c.id == character_id)
+        .values(favorite_count=characters.c.favorite_count + delta)
+    )
+
+
+@event.listens_for(Favorite, "after_insert")
+def _favorite_inserted(mapper, connection, favorite):
+    _increment_favorite_count(connection, favorite.character_id, 1)
+
+
+@event.listens_for(Favorite, "after_delete")
+def _favorite_deleted(mapper, connection, favorite):
+    _increment_favorite_count(connection, favorite.character_id, -1)
@@ -1,7 +1,33 @@
-from sqlalchemy import func, select
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.orm import joinedload, selectinload
 
-from day_26.example_app import app, db
+from day_26.example_app import db, get_app
 from day_26.example_models import Character, Favorite, Film, Planet, User, UserProfile
+from day_26.query_cache import cached_execute
+from day_26.query_counter import count_queries
+
+# Perfiles de carga: que relaciones traer junto con la entidad principal.
+# Sin ellos, cada acceso a user.profile, user.favorites, character.films...
+# lanza una query por fila (problema N+1).
+# - joinedload: relaciones 1-1 / N-1, se traen en la misma query con JOIN.
+# - selectinload: colecciones 1-N / N-N, una query extra con WHERE ... IN (...).
+LOADING_PROFILES = {
+    "user_full": (
+        joinedload(User.profile),
+        selectinload(User.favorites).joinedload(Favorite.character).joinedload(Character.homeworld),
+    ),
+    "character_card": (
+        joinedload(Character.homeworld),
+        selectinload(Character.films),
+    ),
+    "planet_characters": (selectinload(Planet.characters),),
+}
+
+
+def with_profile(stmt, profile=None):
+    if profile is None:
+        return stmt
+    return stmt.options(*LOADING_PROFILES[profile])
 
 
 def insert_seed_data():
@@ -44,9 +70,48 @@ def update_user_email(user_id, new_email):
     return True
 
 
-def select_user_by_username(username):
-    stmt = select(User).where(User.username == username)
-    return db.session.execute(stmt).scalar_one_or_none()
+# Tablas de las que depende cada consulta cacheada (ver query_cache.py).
+USER_LOOKUP_TABLES = ("users", "user_profiles", "favorites", "characters", "planets")
+FILM_CHARACTERS_TABLES = ("films", "character_films", "characters")
+
+
+def select_user_by_username(username, profile=None):
+    stmt = with_profile(select(User).where(User.username == username), profile)
+    return cached_execute(stmt, USER_LOOKUP_TABLES, profile).unique().scalar_one_or_none()
+
+
+def list_users(profile=None):
+    stmt = with_profile(select(User).order_by(User.username.asc()), profile)
+    return db.session.execute(stmt).unique().scalars().all()
+
+
+def list_characters(profile=None):
+    stmt = with_profile(select(Character).order_by(Character.name.asc()), profile)
+    return db.session.execute(stmt).unique().scalars().all()
+
+
+def list_planets(profile=None):
+    stmt = with_profile(select(Planet).order_by(Planet.name.asc()), profile)
+    return db.session.execute(stmt).unique().scalars().all()
+
+
+def user_to_dict(user):
+    return {
+        "username": user.username,
+        "bio": user.profile.bio if user.profile else None,
+        "favorites": [
+            {"character": favorite.character.name, "homeworld": favorite.character.homeworld.name}
+            for favorite in user.favorites
+        ],
+    }
+
+
+def character_to_dict(character):
+    return {
+        "name": character.name,
+        "homeworld": character.homeworld.name,
+        "films": [film.title for film in character.films],
+    }
 
 
 def delete_character_by_name(name):
@@ -61,45 +126,138 @@ def delete_character_by_name(name):
     return True
 
 
-def join_characters_with_homeworld():
-    stmt = (
+def _characters_with_homeworld_stmt():
+    return (
         select(Character.name, Planet.name.label("planet_name"))
         .join(Planet, Character.planet_id == Planet.id)
         .order_by(Character.name.asc())
     )
-    return db.session.execute(stmt).all()
 
 
-def join_users_profiles_favorites():
-    stmt = (
+def join_characters_with_homeworld():
+    return db.session.execute(_characters_with_homeworld_stmt()).all()
+
+
+def _users_profiles_favorites_stmt():
+    return (
         select(User.username, UserProfile.bio, Character.name.label("favorite_character"))
         .join(UserProfile, UserProfile.user_id == User.id)
         .outerjoin(Favorite, Favorite.user_id == User.id)
         .outerjoin(Character, Character.id == Favorite.character_id)
         .order_by(User.username.asc(), Character.name.asc())
     )
-    return db.session.execute(stmt).all()
+
+
+def join_users_profiles_favorites():
+    return db.session.execute(_users_profiles_favorites_stmt()).all()
 
 
 def top_characters_by_favorites(min_users=1):
+    # Lee el contador desnormalizado: recorre ix_characters_favorite_count_name
+    # en orden, sin JOIN ni GROUP BY sobre toda la tabla favorites.
     stmt = (
-        select(Character.name, func.count(Favorite.user_id).label("total_users"))
-        .join(Favorite, Favorite.character_id == Character.id)
-        .group_by(Character.id, Character.name)
-        .having(func.count(Favorite.user_id) >= min_users)
-        .order_by(func.count(Favorite.user_id).desc(), Character.name.asc())
+        select(Character.name, Character.favorite_count.label("total_users"))
+        .where(Character.favorite_count >= max(min_users, 1))
+        .order_by(Character.favorite_count.desc(), Character.name.asc())
     )
     return db.session.execute(stmt).all()
 
 
-def characters_by_film_title(film_title):
+def _counted_favorites():
+    return (
+        select(func.count(Favorite.user_id))
+        .where(Favorite.character_id == Character.id)
+        .scalar_subquery()
+    )
+
+
+def find_favorite_count_mismatches():
+    """Personajes cuyo favorite_count no coincide con COUNT(favorites)."""
+    counted = _counted_favorites()
     stmt = (
+        select(Character.name, Character.favorite_count, counted.label("counted"))
+        .where(Character.favorite_count != counted)
+        .order_by(Character.name.asc())
+    )
+    return db.session.execute(stmt).all()
+
+
+def rebuild_favorite_counts():
+    """Recalcula todos los contadores desde cero; devuelve cuantos estaban mal."""
+    mismatches = len(find_favorite_count_mismatches())
+    db.session.execute(
+        update(Character).values(favorite_count=_counted_favorites()),
+        execution_options={"synchronize_session": False},
+    )
+    db.session.commit()
+    return mismatches
+
+
+def _characters_by_film_title_stmt(film_title):
+    return (
         select(Film.title, Character.name)
         .join(Film.characters)
         .where(Film.title == film_title)
         .order_by(Character.name.asc())
     )
-    return db.session.execute(stmt).all()
+
+
+def characters_by_film_title(film_title):
+    return cached_execute(_characters_by_film_title_stmt(film_title), FILM_CHARACTERS_TABLES).all()
+
+
+# Versiones generador para exportar millones de filas en memoria constante.
+# .all() carga el resultado entero; estas funciones devuelven las filas poco
+# a poco y en el mismo orden.
+#
+# - Keyset: cada pagina es una query nueva con WHERE (name, id) > (ultimo
+#   name, ultimo id) ORDER BY name, id LIMIT n. No usa OFFSET (que recorre
+#   todas las filas anteriores) y no deja una transaccion abierta entre
+#   paginas. Se ordena tambien por id para que el cursor sea unico.
+# - Streaming: una sola query y el cursor se lee por bloques (yield_per).
+#   Sirve cuando el ORDER BY tiene columnas que pueden ser NULL (LEFT JOIN)
+#   y un cursor keyset seria complicado.
+EXPORT_PAGE_SIZE = 1000
+
+
+def iter_keyset(stmt, name_column, id_column, page_size=EXPORT_PAGE_SIZE):
+    """Recorre `stmt` por paginas de keyset sobre (name_column, id_column).
+
+    `stmt` ya debe estar ordenado por name_column ASC; se le anade id_column
+    como desempate y como columna extra, que no aparece en las filas devueltas.
+    """
+    stmt = stmt.add_columns(id_column).order_by(id_column.asc())
+    last_key = None
+    while True:
+        page_stmt = stmt
+        if last_key is not None:
+            page_stmt = stmt.where(tuple_(name_column, id_column) > tuple_(*last_key))
+        rows = db.session.execute(page_stmt.limit(page_size)).all()
+        for row in rows:
+            yield tuple(row[:-1])
+        if len(rows) < page_size:
+            return
+        last_row = rows[-1]
+        last_key = (last_row._mapping[name_column], last_row[-1])
+
+
+def iter_streaming(stmt, page_size=EXPORT_PAGE_SIZE):
+    result = db.session.execute(stmt.execution_options(yield_per=page_size))
+    for partition in result.partitions():
+        for row in partition:
+            yield tuple(row)
+
+
+def iter_characters_with_homeworld(page_size=EXPORT_PAGE_SIZE):
+    return iter_keyset(_characters_with_homeworld_stmt(), Character.name, Character.id, page_size)
+
+
+def iter_users_profiles_favorites(page_size=EXPORT_PAGE_SIZE):
+    return iter_streaming(_users_profiles_favorites_stmt(), page_size)
+
+
+def iter_characters_by_film_title(film_title, page_size=EXPORT_PAGE_SIZE):
+    return iter_keyset(_characters_by_film_title_stmt(film_title), Character.name, Character.id, page_size)
 
 
 def demo():
@@ -124,15 +282,33 @@ def demo():
     for row in join_users_profiles_favorites():
         print(row)
 
-    print("\nJOIN + GROUP BY + HAVING")
+    print("\nRanking por favoritos (contador favorite_count)")
     for row in top_characters_by_favorites(min_users=1):
         print(row)
 
+    print(f"Contadores favorite_count incorrectos: {len(find_favorite_count_mismatches())}")
+
     print("\nJOIN N-N Character <-> Film")
     for row in characters_by_film_title("A New Hope"):
         print(row)
 
+    print("\nExport en memoria constante (keyset por name, id)")
+    for row in iter_characters_with_homeworld(page_size=1):
+        print(row)
+
+    print("\nN+1: queries para serializar usuarios y personajes")
+    for profile in (None, "user_full"):
+        db.session.expire_all()
+        with count_queries() as counter:
+            [user_to_dict(user) for user in list_users(profile)]
+        print(f"users perfil={profile}: {counter.count} queries")
+    for profile in (None, "character_card"):
+        db.session.expire_all()
+        with count_queries() as counter:
+            [character_to_dict(character) for character in list_characters(profile)]
+        print(f"characters perfil={profile}: {counter.count} queries")
+
 
 if __name__ == "__main__":
-    with app.app_context():
+    with get_app().app_context():
         demo()
@@ -0,0 +1,116 @@
+"""Asesor de indices para las consultas de example_queries.py.
+
+Ejecuta cada funcion de consulta, captura el SQL que lanza y lo vuelve a
+pedir con EXPLAIN QUERY PLAN (SQLite) o EXPLAIN (PostgreSQL) sobre el
+engine configurado en DATABASE_URL. Marca los recorridos completos de
+tabla: `SCAN tabla` sin indice en SQLite, `Seq Scan` en PostgreSQL.
+
+Uso:
+
+    python -m day_26.index_advisor              # informe
+    python -m day_26.index_advisor --migration  # genera la migracion
+
+Con --migration se usa el Flask-Migrate de example_app: crea `migrations/`
+si no existe (`db init`) y autogenera una migracion (`db migrate`) con los
+indices que declaran los modelos y aun no estan en la base. No hace el
+informe: las consultas pueden usar columnas que la base aun no tiene.
+Despues:
+
+    flask --app day_26/example_app.py db upgrade
+    flask --app day_26/example_app.py rebuild-favorite-counts
+
+Si la base es anterior a Character.favorite_count, la migracion crea la
+columna a 0: rebuild-favorite-counts la rellena desde `favorites`.
+"""
+import os
+import sys
+
+from sqlalchemy import event
+
+from day_26 import example_queries as queries
+from day_26.example_app import db, get_app
+
+MIGRATIONS_DIR = "migrations"
+MIGRATION_MESSAGE = "add join indexes"
+
+# Cada caso es (nombre, funcion sin argumentos). Los generadores se consumen
+# con list() para que lleguen a ejecutar su SQL.
+QUERY_CASES = [
+    ("select_user_by_username", lambda: queries.select_user_by_username("ana_dev")),
+    ("join_characters_with_homeworld", queries.join_characters_with_homeworld),
+    ("join_users_profiles_favorites", queries.join_users_profiles_favorites),
+    ("top_characters_by_favorites", queries.top_characters_by_favorites),
+    ("characters_by_film_title", lambda: queries.characters_by_film_title("A New Hope")),
+    ("list_users(user_full)", lambda: queries.list_users("user_full")),
+    ("list_characters(character_card)", lambda: queries.list_characters("character_card")),
+    ("list_planets(planet_characters)", lambda: queries.list_planets("planet_characters")),
+    ("iter_characters_by_film_title", lambda: list(queries.iter_characters_by_film_title("A New Hope"))),
+]
+
+
+def capture_statements(function):
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        function()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def explain(statement, parameters):
+    """Devuelve (lineas del plan, lineas marcadas como recorrido completo)."""
+    dialect = db.engine.dialect.name
+    with db.engine.connect() as connection:
+        if dialect == "sqlite":
+            rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            plan = [row[3] for row in rows]
+            full_scans = [line for line in plan if line.startswith("SCAN ") and " INDEX " not in line]
+        elif dialect == "postgresql":
+            rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+            plan = [row[0] for row in rows]
+            full_scans = [line for line in plan if "Seq Scan" in line]
+        else:
+            raise SystemExit(f"EXPLAIN no soportado para el dialecto {dialect}")
+    return plan, full_scans
+
+
+def advise():
+    total_full_scans = 0
+    for name, function in QUERY_CASES:
+        print(f"\n== {name}")
+        for statement, parameters in capture_statements(function):
+            plan, full_scans = explain(statement, parameters)
+            total_full_scans += len(full_scans)
+            print("  " + " ".join(statement.split()))
+            for line in plan:
+                marker = "!!" if line in full_scans else "  "
+                print(f"    {marker} {line}")
+
+    print(f"\nRecorridos completos de tabla: {total_full_scans}")
+    return total_full_scans
+
+
+def generate_migration():
+    import flask_migrate
+
+    if not os.path.isdir(MIGRATIONS_DIR):
+        flask_migrate.init(directory=MIGRATIONS_DIR)
+    flask_migrate.migrate(directory=MIGRATIONS_DIR, message=MIGRATION_MESSAGE)
+    print(
+        "\nSiguiente paso: flask --app day_26/example_app.py db upgrade"
+        " && flask --app day_26/example_app.py rebuild-favorite-counts"
+    )
+
+
+if __name__ == "__main__":
+    with get_app().app_context():
+        if "--migration" in sys.argv[1:]:
+            generate_migration()
+        else:
+            advise()
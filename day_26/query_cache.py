@@ -0,0 +1,157 @@
+"""Cache read-through para consultas de solo lectura muy repetidas.
+
+- Clave: SQL compilado + parametros (+ partes extra, p.ej. el perfil de
+  carga, porque un selectinload no cambia el SQL principal).
+- TTL y expulsion LRU (OrderedDict: lo mas reciente al final).
+- Cada entrada recuerda de que tablas depende. Un flush de la sesion que
+  inserta, modifica o borra filas de esas tablas invalida la entrada
+  (evento after_flush). Tambien se invalida con insert()/update()/delete()
+  ejecutados con db.session.execute (evento do_orm_execute). El SQL a mano
+  sobre la conexion no pasa por aqui: llamar a query_cache.clear().
+- Se guarda un FrozenResult "congelado" (copia via pickle, como en el
+  ejemplo de dogpile caching de SQLAlchemy); en cada acierto se copia a la
+  sesion actual con merge(load=False), sin ir a la base de datos.
+
+Configuracion: QUERY_CACHE_SIZE (entradas, por defecto 1024) y
+QUERY_CACHE_TTL (segundos, por defecto 60). Metricas en GET /health.
+"""
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, loading
+
+from day_26.example_app import db
+
+
+class QueryCache:
+    def __init__(self, max_entries=1024, ttl_seconds=60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, tables, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, frozenset(tables), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_tables(self, tables):
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[1] & tables]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def metrics(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+query_cache = QueryCache(
+    max_entries=int(os.getenv("QUERY_CACHE_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("QUERY_CACHE_TTL", "60")),
+)
+
+
+def cached_execute(stmt, tables, *key_parts):
+    """Ejecuta `stmt` con db.session o devuelve el resultado cacheado.
+
+    `tables`: nombres de las tablas cuyos cambios deben invalidar la entrada.
+    """
+    session = db.session()
+    # session.execute hace autoflush antes de consultar; un acierto de cache
+    # no llega a la base, asi que el flush se hace aqui.
+    if session.autoflush and (session.new or session.dirty or session.deleted):
+        session.flush()
+    # Si esta transaccion ya escribio en alguna de las tablas, el resultado
+    # incluye cambios sin confirmar: ni se lee ni se guarda en la cache.
+    if session.info.get("query_cache_tables", set()) & set(tables):
+        return session.execute(stmt)
+
+    compiled = stmt.compile(dialect=db.engine.dialect)
+    key = (str(compiled), tuple(sorted(compiled.params.items())), key_parts)
+
+    frozen = query_cache.get(key)
+    if frozen is None:
+        frozen = session.execute(stmt).freeze()
+        # Copia independiente de la sesion: un commit que expire los objetos
+        # originales no debe vaciar lo que hay en cache.
+        frozen = pickle.loads(pickle.dumps(frozen))
+        query_cache.put(key, tables, frozen)
+    return loading.merge_frozen_result(session, stmt, frozen, load=False)()
+
+
+def _changed_tables(session):
+    tables = set()
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        state = inspect(instance)
+        tables.update(table.name for table in state.mapper.tables)
+        # Filas de tablas de asociacion (p.ej. character_films) que el ORM
+        # escribe al cambiar una coleccion many-to-many. `history` no carga
+        # colecciones que no esten ya en memoria.
+        for relationship in state.mapper.relationships:
+            if relationship.secondary is None:
+                continue
+            if state.deleted or state.attrs[relationship.key].history.has_changes():
+                tables.add(relationship.secondary.name)
+    return tables
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session, flush_context):
+    tables = _changed_tables(session)
+    if tables:
+        query_cache.invalidate_tables(tables)
+        # Otra sesion puede volver a cachear los datos antiguos entre el
+        # flush y el commit: se invalida otra vez al terminar la transaccion.
+        session.info.setdefault("query_cache_tables", set()).update(tables)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_after_transaction(session):
+    tables = session.info.pop("query_cache_tables", None)
+    if tables:
+        query_cache.invalidate_tables(tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        query_cache.invalidate_tables({orm_execute_state.statement.table.name})
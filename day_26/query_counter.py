@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from day_26.example_app import db
+
+
+class QueryCounter:
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(max_queries=None):
+    """Cuenta las sentencias SQL que se ejecutan dentro del bloque.
+
+    Con `max_queries`, lanza AssertionError si se supera el limite: sirve
+    para detectar problemas N+1 en pruebas.
+    """
+    counter = QueryCounter()
+    event.listen(db.engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(db.engine, "before_cursor_execute", counter)
+
+    if max_queries is not None and counter.count > max_queries:
+        statements = "\n\n".join(counter.statements)
+        raise AssertionError(f"Se esperaban como maximo {max_queries} queries y hubo {counter.count}:\n{statements}")
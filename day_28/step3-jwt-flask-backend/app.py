@@ -0,0 +1,161 @@
+import os
+from datetime import timedelta
+from flask import Flask, jsonify, request
+from flask_sqlalchemy import SQLAlchemy
+from flask_jwt_extended import (
+    JWTManager,
+    create_access_token,
+    jwt_required,
+    get_jwt_identity
+)
+from dotenv import load_dotenv
+
+from password_hashing import HashingBusy, hasher
+
+load_dotenv()
+
+# =========================
+# Configuración
+# =========================
+app = Flask(__name__)
+app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", "sqlite:///app.db")
+app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "dev-secret-key")
+app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=1)
+
+db = SQLAlchemy(app)
+jwt = JWTManager(app)
+
+
+# =========================
+# Modelo
+# =========================
+class User(db.Model):
+    __tablename__ = "users"
+
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)
+    created_at = db.Column(db.DateTime, default=db.func.now())
+
+    # bcrypt se ejecuta en el pool de procesos de password_hashing.py
+    def set_password(self, password):
+        self.password_hash = hasher.hash_password(password)
+
+    def check_password(self, password):
+        return hasher.check_password(password, self.password_hash)
+
+    def serialize(self):
+        return {
+            "id": self.id,
+            "email": self.email,
+            "username": self.username,
+            "created_at": self.created_at.isoformat() if self.created_at else None
+        }
+
+
+# =========================
+# Error handlers JWT
+# =========================
+@jwt.expired_token_loader
+def expired_token_callback(jwt_header, jwt_payload):
+    return jsonify({"error": "Token expirado"}), 401
+
+@jwt.invalid_token_loader
+def invalid_token_callback(error):
+    return jsonify({"error": "Token inválido"}), 401
+
+@jwt.unauthorized_loader
+def missing_token_callback(error):
+    return jsonify({"error": "Token requerido"}), 401
+
+
+# Cola de hashes llena: mejor un 503 rapido que un timeout
+@app.errorhandler(HashingBusy)
+def hashing_busy(error):
+    return jsonify({"error": "Servidor ocupado, intenta de nuevo"}), 503, {"Retry-After": "1"}
+
+
+# =========================
+# Endpoints públicos
+# =========================
+@app.route("/api/signup", methods=["POST"])
+def signup():
+    body = request.get_json()
+
+    if not body:
+        return jsonify({"error": "Body requerido"}), 400
+
+    for field in ["email", "username", "password"]:
+        if field not in body or not body[field]:
+            return jsonify({"error": f"{field} es requerido"}), 400
+
+    existing = User.query.filter(
+        (User.email == body["email"]) | (User.username == body["username"])
+    ).first()
+
+    if existing:
+        return jsonify({"error": "El email o username ya existe"}), 400
+
+    new_user = User(email=body["email"], username=body["username"])
+    new_user.set_password(body["password"])
+
+    db.session.add(new_user)
+    db.session.commit()
+
+    return jsonify({"message": "Usuario creado", "user": new_user.serialize()}), 201
+
+
+@app.route("/api/login", methods=["POST"])
+def login():
+    body = request.get_json()
+
+    if not body or "email" not in body or "password" not in body:
+        return jsonify({"error": "Email y password requeridos"}), 400
+
+    user = User.query.filter_by(email=body["email"]).first()
+
+    if user is None or not user.check_password(body["password"]):
+        return jsonify({"error": "Credenciales inválidas"}), 401
+
+    access_token = create_access_token(identity=str(user.id))
+
+    return jsonify({
+        "access_token": access_token,
+        "user": user.serialize()
+    }), 200
+
+
+# =========================
+# Endpoints protegidos
+# =========================
+@app.route("/api/profile", methods=["GET"])
+@jwt_required()
+def get_profile():
+    current_user_id = get_jwt_identity()
+    user = User.query.get(current_user_id)
+
+    if user is None:
+        return jsonify({"error": "Usuario no encontrado"}), 404
+
+    return jsonify(user.serialize()), 200
+
+
+@app.route("/api/private", methods=["GET"])
+@jwt_required()
+def private():
+    current_user_id = get_jwt_identity()
+    return jsonify({
+        "message": "Este es un endpoint privado",
+        "user_id": current_user_id
+    }), 200
+
+
+# =========================
+# Main
+# =========================
+if __name__ == "__main__":
+    with app.app_context():
+        db.create_all()
+    app.run(debug=True)
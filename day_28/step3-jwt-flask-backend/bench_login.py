@@ -0,0 +1,91 @@
+"""Benchmark: logins por segundo con bcrypt en el hilo vs en el pool.
+
+Usa una base SQLite temporal y el cliente de pruebas de Flask desde varios
+hilos (como un worker con hilos de gunicorn). Compara:
+
+- HASH_WORKERS=0: bcrypt dentro del hilo de la peticion (version original);
+- pools de 1, 2, 4... procesos hasta el numero de nucleos.
+
+Uso:
+    python bench_login.py
+    BCRYPT_ROUNDS=10 python bench_login.py   # mas rapido, mismo patron
+"""
+import os
+import tempfile
+import threading
+import time
+
+_database_dir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_database_dir.name, 'bench.db')}"
+
+import app as app_module  # noqa: E402
+from password_hashing import BCRYPT_ROUNDS, PasswordHasher  # noqa: E402
+
+CLIENT_THREADS = 16
+DURATION_SECONDS = 5.0
+BUSY_BACKOFF_SECONDS = 0.05
+CREDENTIALS = {"email": "bench@example.com", "password": "secreto123"}
+
+
+def pool_sizes():
+    cores = os.cpu_count() or 1
+    sizes = [0]
+    size = 1
+    while size < cores:
+        sizes.append(size)
+        size *= 2
+    sizes.append(cores)
+    return sizes
+
+
+def run_clients():
+    results = {"ok": 0, "busy": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + DURATION_SECONDS
+
+    def client():
+        test_client = app_module.app.test_client()
+        ok = busy = 0
+        while time.perf_counter() < deadline:
+            response = test_client.post("/api/login", json=CREDENTIALS)
+            if response.status_code == 200:
+                ok += 1
+            elif response.status_code == 503:
+                # Un cliente real respeta Retry-After; aqui basta con esperar un poco.
+                busy += 1
+                time.sleep(BUSY_BACKOFF_SECONDS)
+            else:
+                raise RuntimeError(f"login fallo: {response.status_code} {response.get_json()}")
+        with lock:
+            results["ok"] += ok
+            results["busy"] += busy
+
+    threads = [threading.Thread(target=client) for _ in range(CLIENT_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def bench():
+    with app_module.app.app_context():
+        app_module.db.create_all()
+    response = app_module.app.test_client().post("/api/signup", json={**CREDENTIALS, "username": "bench"})
+    assert response.status_code == 201, response.get_json()
+
+    print(f"bcrypt rounds={BCRYPT_ROUNDS}, {os.cpu_count()} nucleos, {CLIENT_THREADS} clientes concurrentes")
+    for workers in pool_sizes():
+        hasher = PasswordHasher(workers=workers, max_pending=max(workers, 1) * 4)
+        app_module.hasher = hasher
+        results = run_clients()
+        hasher.shutdown()
+        label = "en el hilo" if workers == 0 else f"pool de {workers}"
+        print(
+            f"  {label:<12} {results['ok'] / DURATION_SECONDS:>8.1f} logins/s"
+            f"  {results['busy']:>6} respuestas 503"
+        )
+
+
+if __name__ == "__main__":
+    bench()
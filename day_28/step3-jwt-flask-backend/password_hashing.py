@@ -0,0 +1,119 @@
+"""bcrypt fuera del hilo de la peticion, en un pool de procesos acotado.
+
+bcrypt es lento a proposito (~100-250 ms de CPU por hash). Si se llama
+dentro del handler, cada login ocupa el worker entero durante ese tiempo.
+Aqui el hash se envia a un ProcessPoolExecutor: usa todos los nucleos y el
+hilo de la peticion solo espera el resultado.
+
+Contrapresion: como mucho HASH_MAX_PENDING hashes (en cola + en curso).
+Si se supera, `HashingBusy` -> la app responde 503 en vez de acumular
+peticiones que acabarian en timeout. Tambien es `HashingBusy` un hash que
+tarda mas de HASH_TIMEOUT_SECONDS o un pool roto (un proceso hijo murio):
+el pool roto se descarta y la siguiente peticion crea uno nuevo.
+
+Los procesos se arrancan con "forkserver" (o "spawn" donde no existe),
+nunca con fork: el pool se crea desde un hilo de peticion y hacer fork de
+un proceso con varios hilos puede heredar locks que otro hilo tiene cogidos.
+
+Variables de entorno:
+- BCRYPT_ROUNDS: factor de trabajo (por defecto 12; cada +1 duplica el coste).
+- HASH_WORKERS: procesos del pool (por defecto, numero de nucleos).
+  Con 0 se hashea en el propio hilo, como antes.
+- HASH_MAX_PENDING: limite de la cola (por defecto 4 x HASH_WORKERS).
+"""
+import multiprocessing
+import os
+import threading
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import bcrypt
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", str(os.cpu_count() or 1)))
+HASH_MAX_PENDING = int(os.getenv("HASH_MAX_PENDING", str(max(HASH_WORKERS, 1) * 4)))
+HASH_TIMEOUT_SECONDS = 30
+HASH_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class HashingBusy(Exception):
+    """No se puede hashear ahora (cola llena, timeout o pool roto): el cliente debe reintentar."""
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _check(password, password_hash):
+    return bcrypt.checkpw(password, password_hash)
+
+
+class PasswordHasher:
+    def __init__(self, workers=HASH_WORKERS, max_pending=HASH_MAX_PENDING, rounds=BCRYPT_ROUNDS):
+        self.workers = workers
+        self.rounds = rounds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self):
+        # Se crea al primer uso, ya dentro del worker (gunicorn hace fork
+        # despues de importar la app y un pool no sobrevive a un fork).
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context(HASH_START_METHOD),
+                    )
+        return self._executor
+
+    def _discard_executor(self, executor):
+        # Un ProcessPoolExecutor roto no se recupera: todo submit posterior
+        # falla. Se suelta para que _get_executor cree otro.
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def _run(self, function, *args):
+        if self.workers == 0:
+            return function(*args)
+
+        if not self._slots.acquire(blocking=False):
+            raise HashingBusy()
+        try:
+            executor = self._get_executor()
+            future = executor.submit(function, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._discard_executor(executor)
+            raise HashingBusy()
+        except BaseException:
+            self._slots.release()
+            raise
+        # El hueco se libera cuando el hash termina, no cuando se deja de
+        # esperar: un hash que supera el timeout sigue contando en la cola.
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=HASH_TIMEOUT_SECONDS)
+        except futures.TimeoutError:
+            raise HashingBusy()
+        except BrokenProcessPool:
+            self._discard_executor(executor)
+            raise HashingBusy()
+
+    def hash_password(self, password):
+        return self._run(_hash, password.encode("utf-8"), self.rounds).decode("utf-8")
+
+    def check_password(self, password, password_hash):
+        return self._run(_check, password.encode("utf-8"), password_hash.encode("utf-8"))
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+hasher = PasswordHasher()